@@ -1,34 +1,83 @@
 # Initial params could be foun in https://dev.mysql.com/doc/connector-python/en/connector-python-connectargs.html
 #
+# Protocol compression is disabled by default. On localhost or LAN links zlib
+# costs more CPU than the bandwidth it saves, and compressing every packet slows
+# down the row copy loop. Use build_config() to turn it on for remote hosts.
+#
+# Connection configs and system databases are read-only: they are shared by every
+# thread, so they are exposed as MappingProxyType/frozenset objects.
+#
+# Pooled sessions are not reset when they are handed back (pool_reset_session), as a
+# reset would also undo autocommit and init_command. Every borrower selects its own
+# default database and key checks, and restores any other session variable it changes.
+import os
+import tempfile
+from types import MappingProxyType
+from typing import Final, Mapping
+
+# Packet parsing and row decoding run much faster in the C extension, which ships
+# with Oracle's mysql-connector-python wheels. Fall back to pure Python only if
+# it is not installed.
+try:
+    import _mysql_connector  # noqa: F401
+    c_extension_available = True
+except ImportError:
+    c_extension_available = False
 
 # Source database config
-source_config = {
+SOURCE_CONFIG: Final = MappingProxyType({
     'user': 'user',
     'password': 'password',
     'host': '127.0.0.1',
     'port': 3307,
-    'compress': True,
-    'buffered': True
-}
+    'compress': False,
+    'use_pure': not c_extension_available,
+    # Table data is read with unbuffered cursors; metadata queries ask for buffered ones
+    'buffered': False,
+    'consume_results': True,
+    'connection_timeout': 30,
+    'get_warnings': False,
+    'raise_on_warnings': False,
+    # Reuse sockets instead of paying a full handshake for every connect()
+    'pool_name': 'migrator_src',
+    'pool_size': 8,
+    'pool_reset_session': False
+})
 
 # Destination database config
-destination_config = {
+DESTINATION_CONFIG: Final = MappingProxyType({
     'user': 'user',
     'password': 'password',
     'host': '127.0.0.1',
     'port': 3308,
-    'compress': True,
-    'buffered': True
-}
+    'compress': False,
+    'use_pure': not c_extension_available,
+    'buffered': True,
+    'autocommit': False,
+    'connection_timeout': 30,
+    'get_warnings': False,
+    'raise_on_warnings': False,
+    'pool_name': 'migrator_dst',
+    'pool_size': 8,
+    'pool_reset_session': False,
+    # Bulk load friendly session: bigger insert buffer. Unique and foreign key checks are only
+    # disabled by the sessions copying schemas and table data (see connect in db.py)
+    'init_command': 'SET SESSION bulk_insert_buffer_size = 268435456'
+})
 
 # These are mysql system databases.
 # They don't have to be migrated.
-sys_databases = [
+SYS_DATABASES: Final = frozenset({
     'information_schema',
     'performance_schema',
     'sys',
     'mysql'
-]
+})
+
+# Lowercase aliases used across the code base
+source_config = SOURCE_CONFIG
+destination_config = DESTINATION_CONFIG
+sys_databases = SYS_DATABASES
 
 # This is the list of databases to migrate.
 # If empty, all found databases (except sys_databases) will be migrated.
@@ -38,3 +87,45 @@ databases_to_migrate = []
 # This is a list of databases won't be migrated.
 # If empty, all databases in 'databases_to_migrate' list (all if it's empty) will be migrated.
 databases_to_avoid = []
+
+# Both lists above are only used for membership checks, so freeze them
+# into sets once at import time.
+databases_to_migrate = frozenset(databases_to_migrate)
+databases_to_avoid = frozenset(databases_to_avoid)
+
+# Load table data using LOAD DATA LOCAL INFILE instead of INSERT statements. It's much
+# faster for big tables, but the destination server must run with local_infile=ON.
+# Rows which can't be loaded (duplicates, bad values) are skipped with a warning.
+# The --bulk-transfer flag sets it at runtime.
+load_data_local_infile = False
+
+# Folder for the temporary LOAD DATA files (tmpfs if available, to avoid disk writes)
+load_data_path = '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir()
+
+# Hosts considered local. Compression is never enabled automatically for them.
+local_hosts: Final = frozenset({'127.0.0.1', 'localhost', '::1'})
+
+# Protocol compression for both connections. None enables it only for remote (non local) hosts,
+# True/False force it on or off. It pays off on bandwidth-bound links, mostly for text-heavy tables.
+use_compression = None
+
+
+def build_config(base: Mapping, *, compress: bool = None) -> dict:
+    """
+    Build the connection arguments for mysql.connector from a base config.
+
+    :param base: The base config (source_config or destination_config).
+    :param compress: Force protocol compression on or off. If None, use_compression is used and, if it's
+                     None too, it's enabled when the base config asks for it or when the host is not a local one.
+    :return: A new dict with the connection arguments.
+    """
+    config = dict(base)
+
+    # Compression only pays off on bandwidth-constrained (remote) links
+    if compress is None:
+        compress = use_compression
+    if compress is None:
+        compress = config.get('compress', False) or config.get('host') not in local_hosts
+
+    config['compress'] = compress
+    return config
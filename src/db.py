@@ -4,25 +4,41 @@ import time as tm
 import concurrent.futures
 import threading
 import os
+import tempfile
+import itertools
+import config
 from time import sleep
+from functools import lru_cache
+from contextlib import contextmanager
 from mysql.connector import errorcode
+from mysql.connector.errors import PoolError
+from mysql.connector.pooling import MySQLConnectionPool, CNX_POOL_MAXSIZE
 from tqdm.std import tqdm
-from logs import log_message, LogType
-from mysql.connector.cursor_cext import CMySQLCursorBuffered
-from mysql.connector.connection_cext import CMySQLConnection
+from logs import log_message, flush_logs, LogType
 from progress import update_pbar, create_pbar, close_pbar, PbarColors, PbarPrompts, generate_progress_prompts
-from config import databases_to_avoid, databases_to_migrate, sys_databases
-from datetime import datetime, date, time
+from config import databases_to_avoid, databases_to_migrate, sys_databases, source_config, destination_config, build_config, c_extension_available
+from datetime import datetime, date, time, timedelta
 from colorama import Fore, Style, Back
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Callable, Optional, Iterator, ContextManager
 from failed import add_failed_database, exists_failed_databases, get_failed_dbs
-from config import source_config, destination_config
 
+# The C extension classes fail to import if the extension is missing. The pure Python connector is used
+# then (see use_pure in config), so its classes are the ones used in type hints
+if c_extension_available:
+    from mysql.connector.cursor_cext import CMySQLCursorBuffered
+    from mysql.connector.connection_cext import CMySQLConnection
+else:
+    from mysql.connector.cursor import MySQLCursorBuffered as CMySQLCursorBuffered
+    from mysql.connector.connection import MySQLConnection as CMySQLConnection
 
-# Create a lock to protect database operations
-db_lock = threading.Lock()
 
+# Databases which are never migrated, and databases to migrate (None means all of them)
+excluded_databases = sys_databases | databases_to_avoid
+included_databases = databases_to_migrate or None
 
+
+# Both database lists are frozen at import, so every decision can be cached
+@lru_cache(maxsize=None)
 def is_db_listed_as_migrable(db_name: str) -> bool:
     """
     Check if a database is listed as migrable.
@@ -30,20 +46,9 @@ def is_db_listed_as_migrable(db_name: str) -> bool:
     :param db_name: Name of the database to check.
     :return: True if the database is migrable, False otherwise.
     """
-    # Must not be in sys_databases collection
-    if db_name in sys_databases:
-        return False
-
-    # Must not be in databases_to_avoid collection
-    if db_name in databases_to_avoid:
-        return False
-
-    # Is it in the databases_to_migrate list?
-    if db_name in databases_to_migrate:
-        return True
-
-    # Migrate only if databases_to_migrate is empty
-    return len(databases_to_migrate) == 0
+    # Must not be a system database nor listed in databases_to_avoid, and must be
+    # in databases_to_migrate unless that list is empty
+    return db_name not in excluded_databases and (included_databases is None or db_name in included_databases)
 
 
 def escape_value(value: object, columns: List[object], index: int, row: List[Tuple]) -> object:
@@ -56,16 +61,25 @@ def escape_value(value: object, columns: List[object], index: int, row: List[Tup
     :param row: The row data from the database.
     :return: The formatted value.
     """
-    # Get column type from the column definition
-    column_type = columns[index][1]
+    # Handle NULL values, with special treatment for date-related fields
+    if value is None:
+        if columns[index][1] in zero_date_types:
+            return zero_date
+        return None
+
+    return convert_value(value)
+
 
+def convert_value(value: object) -> object:
+    """
+    Escape and format a non NULL database value of any type.
+
+    :param value: The value from the database.
+    :return: The formatted value.
+    """
     # Handle string values, including boolean strings
     if isinstance(value, str):
-        if value.lower() == 'true':
-            return 1
-        elif value.lower() == 'false':
-            return 0
-        return value
+        return convert_text(value)
 
     # Handle set values by joining them into a string
     elif isinstance(value, set):
@@ -83,97 +97,348 @@ def escape_value(value: object, columns: List[object], index: int, row: List[Tup
     elif isinstance(value, decimal.Decimal):
         return str(value)
 
-    # Handle NULL values, with special treatment for date-related fields
-    elif value is None:
-        if column_type is mysql.connector.constants.FieldType.DATE:
-            return datetime.strptime('0001-01-01', '%Y-%m-%d').isoformat()
-        elif column_type is mysql.connector.constants.FieldType.DATETIME:
-            return datetime.strptime('0001-01-01 00:00:00', '%Y-%m-%d %H:%M:%S').isoformat()
-        elif column_type is mysql.connector.constants.FieldType.TIMESTAMP:
-            return None
+    # Return the value if no specific handling is required
+    return value
 
-        return None
 
-    # Return the value if no specific handling is required
-    else:
+def convert_text(value: object) -> object:
+    """
+    Converter for text columns (CHAR, VARCHAR, TEXT, ENUM, SET, JSON, BLOB...).
+
+    :param value: The value from the database.
+    :return: The formatted value.
+    """
+    if isinstance(value, str):
+        # Boolean strings are stored as integers. Only lowercase values which may match
+        if len(value) in (4, 5):
+            lowered = value.lower()
+            if lowered == 'true':
+                return 1
+            elif lowered == 'false':
+                return 0
         return value
 
+    # SET columns come as a set of strings
+    elif isinstance(value, set):
+        return ','.join(value)
+
+    # Binary values and NULL
+    return value
+
+
+def convert_decimal(value: decimal.Decimal) -> str:
+    """
+    Converter for nullable DECIMAL columns.
+
+    :param value: The value from the database.
+    :return: The formatted value.
+    """
+    return None if value is None else str(value)
+
+
+def convert_date(value: date) -> str:
+    """
+    Converter for DATE and DATETIME columns. NULL (and zero dates, which are read as NULL)
+    are replaced by the lowest valid date.
+
+    :param value: The value from the database.
+    :return: The formatted value.
+    """
+    return zero_date if value is None else value.isoformat()
+
+
+def convert_timestamp(value: datetime) -> str:
+    """
+    Converter for TIMESTAMP columns.
+
+    :param value: The value from the database.
+    :return: The formatted value.
+    """
+    return None if value is None else value.isoformat()
+
+
+# Value used for NULL dates
+zero_date = datetime(1, 1, 1).isoformat()
+
+# Date column types whose NULL values are replaced by zero_date
+zero_date_types = frozenset({
+    mysql.connector.constants.FieldType.DATE,
+    mysql.connector.constants.FieldType.NEWDATE,
+    mysql.connector.constants.FieldType.DATETIME
+})
+
+# Column types whose values never need escaping (numbers and TIME, which comes as timedelta)
+passthrough_types = frozenset({
+    mysql.connector.constants.FieldType.BIT,
+    mysql.connector.constants.FieldType.DOUBLE,
+    mysql.connector.constants.FieldType.FLOAT,
+    mysql.connector.constants.FieldType.INT24,
+    mysql.connector.constants.FieldType.LONG,
+    mysql.connector.constants.FieldType.LONGLONG,
+    mysql.connector.constants.FieldType.SHORT,
+    mysql.connector.constants.FieldType.TINY,
+    mysql.connector.constants.FieldType.YEAR,
+    mysql.connector.constants.FieldType.TIME
+})
+
+# Column types read as strings, sets or bytes
+text_types = frozenset({
+    mysql.connector.constants.FieldType.VARCHAR,
+    mysql.connector.constants.FieldType.VAR_STRING,
+    mysql.connector.constants.FieldType.STRING,
+    mysql.connector.constants.FieldType.ENUM,
+    mysql.connector.constants.FieldType.SET,
+    mysql.connector.constants.FieldType.JSON,
+    mysql.connector.constants.FieldType.TINY_BLOB,
+    mysql.connector.constants.FieldType.MEDIUM_BLOB,
+    mysql.connector.constants.FieldType.LONG_BLOB,
+    mysql.connector.constants.FieldType.BLOB
+})
+
+# Decimal column types
+decimal_types = frozenset({
+    mysql.connector.constants.FieldType.DECIMAL,
+    mysql.connector.constants.FieldType.NEWDECIMAL
+})
+
+
+def pick_converter(field_type: int, null_ok: bool = True) -> Optional[Callable[[object], object]]:
+    """
+    Picks the converter for a column type, so values don't go through the whole escape_value dispatch.
+
+    :param field_type: The column type (mysql.connector.constants.FieldType).
+    :param null_ok: Whether the column accepts NULL values.
+    :return: The converter, or None if the column values don't need escaping.
+    """
+    if field_type in passthrough_types:
+        return None
+    elif field_type in text_types:
+        return convert_text
+    elif field_type in decimal_types:
+        # NOT NULL columns can use str() directly
+        return convert_decimal if null_ok else str
+    elif field_type in zero_date_types:
+        # Zero dates are read as NULL, even for NOT NULL columns
+        return convert_date
+    elif field_type == mysql.connector.constants.FieldType.TIMESTAMP:
+        return convert_timestamp
+
+    # Any other type goes through the generic conversion
+    return convert_value
+
+
+def get_column_converters(columns: List[object]) -> List[Optional[Callable[[object], object]]]:
+    """
+    Picks, once per table, the function used to escape the values of every column.
+
+    :param columns: The column definitions of the table (cursor description).
+    :return: A list with a converter per column, or None if the column values don't need escaping.
+    """
+    return [pick_converter(column[1], bool(column[6])) for column in columns]
+
+
+def resolve_batch(rows: List[Tuple], converters: List[Optional[Callable[[object], object]]]) -> List[Tuple]:
+    """
+    Escapes a batch of rows column by column, skipping the columns which don't need it.
+
+    :param rows: The rows read from the source table.
+    :param converters: The converters returned by get_column_converters.
+    :return: The escaped rows.
+    """
+    # Transpose the batch, convert every column and transpose it back
+    resolved_columns = [column if converter is None else map(converter, column) for converter, column in zip(converters, zip(*rows))]
+    return list(zip(*resolved_columns))
+
 
 def escape_column_name(column_name: str) -> str:
     """
-    Escapes a MySQL column name by surrounding it with backticks.
+    Escapes a MySQL identifier (column or table name) by surrounding it with backticks.
 
     :param column_name: The column name to escape.
     :return: The escaped column name.
     """
-    # Surround column name with backticks for MySQL syntax
-    return f"`{column_name}`"
+    # Surround column name with backticks for MySQL syntax, doubling the backticks it may contain
+    return f"`{column_name.replace('`', '``')}`"
+
+
+# Maximum size of a pipelined multi-statement query (way below the default max_allowed_packet)
+max_multi_statement_size = 1024 * 1024
+
+
+def show_create_statements(cursor: CMySQLCursorBuffered, kind: str, names: List[str], index: int) -> Dict[str, Tuple[str, str]]:
+    """
+    Retrieve the definitions of several objects of the same kind, pipelining the SHOW CREATE
+    statements in multi-statement queries instead of paying a round-trip per object.
+
+    :param cursor: A buffered MySQL cursor to execute queries.
+    :param kind: The object kind (TABLE, VIEW, TRIGGER, PROCEDURE or FUNCTION).
+    :param names: The names of the objects.
+    :param index: The column of the SHOW CREATE result holding the definition.
+    :return: A dictionary with the kind and definition of every object.
+    """
+    create_statements = {}
+    batch = []
+    batch_size = 0
+
+    def flush() -> None:
+        # Result sets come back in the same order as the statements
+        cursor.execute(' '.join(f"SHOW CREATE {kind} {escape_column_name(name)};" for name in batch))
+        for name, (_, result) in zip(batch, cursor.fetchsets()):
+            create_statements[name] = (kind, result[0][index] + ";")
+
+    for name in names:
+        # Names with backticks are rare, fetch them one by one
+        if '`' in name:
+            cursor.execute(f"SHOW CREATE {kind} {escape_column_name(name)}")
+            create_statements[name] = (kind, cursor.fetchone()[index] + ";")
+            continue
+
+        # Keep every query under the size limit
+        statement_size = len(kind) + len(name) + 16
+        if batch and batch_size + statement_size > max_multi_statement_size:
+            flush()
+            batch = []
+            batch_size = 0
+
+        batch.append(name)
+        batch_size += statement_size
+
+    if batch:
+        flush()
+
+    return create_statements
+
+
+def execute_statements(cursor: CMySQLCursorBuffered, statements: List[str]) -> None:
+    """
+    Executes several statements without result sets, pipelined in multi-statement queries
+    (one round-trip per max_multi_statement_size bytes) instead of one round-trip per statement.
+
+    :param cursor: A buffered MySQL cursor to execute queries.
+    :param statements: The statements, without the trailing semicolon.
+    :return: None
+    """
+    batch = []
+    batch_size = 0
+
+    for statement in statements:
+        # Keep every query under the size limit
+        if batch and batch_size + len(statement) + 2 > max_multi_statement_size:
+            cursor.execute(' '.join(batch))
+            for _ in cursor.fetchsets():
+                pass
+            batch = []
+            batch_size = 0
+
+        batch.append(f"{statement};")
+        batch_size += len(statement) + 2
 
+    if batch:
+        cursor.execute(' '.join(batch))
+        for _ in cursor.fetchsets():
+            pass
 
-def get_database_schema(cursor: CMySQLCursorBuffered, db_name: str, tables: List[str]) -> bool:
+
+def get_database_schema(cursor: CMySQLCursorBuffered, db_name: str, tables: List[str]) -> Dict[str, Tuple[str, str]]:
     """
     Retrieve the schema of a MySQL database, including table, view, trigger, procedure, and function definitions.
 
     :param cursor: A buffered MySQL cursor to execute queries.
     :param db_name: The name of the database to retrieve schema from.
     :param tables: A tuple of specific tables to retrieve the schema for.
-    :return: A dictionary with schema definitions for tables, views, triggers, procedures, and functions.
+    :return: A dictionary with the kind (TABLE, VIEW, TRIGGER, PROCEDURE or FUNCTION) and definition
+             of every table, view, trigger, procedure, and function.
     """
     # Dictionary to store schema statements
     create_statements = {}
 
     # Switch to the specified database
-    cursor.execute(f"USE `{db_name}`")
+    cursor.execute(f"USE {escape_column_name(db_name)}")
 
     # Get all table definitions if a list of tables is provided
     if tables:
-        for table_name in tables:
-            cursor.execute(f"SHOW CREATE TABLE `{table_name}`")
-            create_statements[table_name] = cursor.fetchone()[1] + ";"
+        create_statements.update(show_create_statements(cursor, 'TABLE', tables, 1))
 
     # Get all view definitions
-    cursor.execute(f"SHOW FULL TABLES IN `{db_name}` WHERE TABLE_TYPE LIKE 'VIEW'")
-    views = cursor.fetchall()
-    for view in views:
-        cursor.execute(f"SHOW CREATE VIEW `{view[0]}`")
-        create_statements[view[0]] = cursor.fetchone()[1] + ";"
+    cursor.execute(f"SHOW FULL TABLES IN {escape_column_name(db_name)} WHERE TABLE_TYPE LIKE 'VIEW'")
+    views = [view[0] for view in cursor.fetchall()]
+    create_statements.update(show_create_statements(cursor, 'VIEW', views, 1))
 
     # Get all trigger definitions
     cursor.execute("SHOW TRIGGERS")
-    triggers = cursor.fetchall()
-    for trigger in triggers:
-        cursor.execute(f"SHOW CREATE TRIGGER `{trigger[0]}`")
-        create_statements[trigger[0]] = cursor.fetchone()[2] + ";"
+    triggers = [trigger[0] for trigger in cursor.fetchall()]
+    create_statements.update(show_create_statements(cursor, 'TRIGGER', triggers, 2))
 
     # Get all procedure definitions
-    cursor.execute(f"SHOW PROCEDURE STATUS WHERE Db = '{db_name}'")
-    procedures = cursor.fetchall()
-    for procedure in procedures:
-        cursor.execute(f"SHOW CREATE PROCEDURE `{procedure[1]}`")
-        create_statements[procedure[1]] = cursor.fetchone()[2] + ";"
+    cursor.execute("SHOW PROCEDURE STATUS WHERE Db = %s", (db_name,))
+    procedures = [procedure[1] for procedure in cursor.fetchall()]
+    create_statements.update(show_create_statements(cursor, 'PROCEDURE', procedures, 2))
 
     # Get all function definitions
-    cursor.execute(f"SHOW FUNCTION STATUS WHERE Db = '{db_name}'")
-    functions = cursor.fetchall()
-    for function in functions:
-        cursor.execute(f"SHOW CREATE FUNCTION `{function[1]}`")
-        create_statements[function[1]] = cursor.fetchone()[2] + ";"
+    cursor.execute("SHOW FUNCTION STATUS WHERE Db = %s", (db_name,))
+    functions = [function[1] for function in cursor.fetchall()]
+    create_statements.update(show_create_statements(cursor, 'FUNCTION', functions, 2))
 
     # Return the dictionary containing the schema definitions
     return create_statements
 
 
-def change_keys_status(cursor: CMySQLCursorBuffered, enabled: bool = False) -> None:
+def change_keys_status(conn: CMySQLConnection, cursor: CMySQLCursorBuffered, enabled: bool = False) -> None:
     """
-    Enable or disable the foreign key checks in MySQL.
+    Enable or disable the unique and foreign key checks of a session. Pooled sessions keep them, so
+    the state is remembered on the connection (like is_session_configured) and only sent if it changes.
 
-    :param cursor: A buffered MySQL cursor to execute the query.
+    :param conn: The connection (pooled or not).
+    :param cursor: A buffered MySQL cursor of the connection to execute the query.
     :param enabled: If True, enables foreign key checks. If False, disables them.
     :return: None
     """
+    cnx = getattr(conn, '_cnx', conn)
+    state = (cnx.connection_id, enabled)
+    if getattr(cnx, 'migrator_key_checks', None) == state:
+        return
+
     # Disable or enable unique and foreign key checks based on the 'enabled' parameter
-    cursor.execute(f"SET UNIQUE_CHECKS = {1 if enabled else 0}")
-    cursor.execute(f"SET FOREIGN_KEY_CHECKS = {1 if enabled else 0}")
+    cursor.execute(f"SET UNIQUE_CHECKS = {1 if enabled else 0}, FOREIGN_KEY_CHECKS = {1 if enabled else 0}")
+    cnx.migrator_key_checks = state
+
+
+# Destination server variables relaxed by --fast-unsafe. Both are global only (no session scope)
+fast_unsafe_variables = {
+    'innodb_flush_log_at_trx_commit': 2,
+    'sync_binlog': 0
+}
+
+
+def relax_destination_durability() -> Dict[str, object]:
+    """
+    Reduces the fsyncs of the destination server during the migration (--fast-unsafe). A crash
+    of the destination server may lose the last second of migrated data.
+
+    :return: A dictionary with the original values, to be passed to restore_destination_durability.
+    """
+    with get_dst_conn() as (dst_conn, dst_cur):
+        # Keep the original values
+        dst_cur.execute(f"SELECT {', '.join(f'@@GLOBAL.{name}' for name in fast_unsafe_variables)}")
+        original_values = dict(zip(fast_unsafe_variables, dst_cur.fetchone()))
+
+        # Relax durability
+        dst_cur.execute(f"SET GLOBAL {', GLOBAL '.join(f'{name} = {value}' for name, value in fast_unsafe_variables.items())}")
+        return original_values
+
+
+def restore_destination_durability(original_values: Dict[str, object]) -> None:
+    """
+    Restores the destination server variables changed by relax_destination_durability.
+
+    :param original_values: The values returned by relax_destination_durability.
+    :return: None
+    """
+    if not original_values:
+        return
+
+    with get_dst_conn() as (dst_conn, dst_cur):
+        dst_cur.execute(f"SET GLOBAL {', GLOBAL '.join(f'{name} = %s' for name in original_values)}", tuple(original_values.values()))
 
 
 def migrate_schema(db_name: str) -> List[str]:
@@ -186,17 +451,14 @@ def migrate_schema(db_name: str) -> List[str]:
     """
     try:
         # Establish connections to source and destination databases
-        src_cur, dst_cur, src_conn, dst_conn = connect(set_session_vars=False, src_db=db_name)
-
-        # Disable foreign key checks on destination database
-        change_keys_status(cursor=dst_cur, enabled=False)
+        src_cur, dst_cur, src_conn, dst_conn = connect(set_session_vars=False, src_db=db_name, key_checks=False)
 
         # Create the database on the destination server
-        dst_cur.execute(f"CREATE DATABASE `{db_name}`")
-        dst_cur.execute(f"USE `{db_name}`")
+        dst_cur.execute(f"CREATE DATABASE {escape_column_name(db_name)}")
+        dst_cur.execute(f"USE {escape_column_name(db_name)}")
 
         # Get all tables in correct creation order
-        tables = get_all_tables(databases=[db_name], cursor=src_cur)
+        tables = get_all_tables(databases=[db_name], cursor=src_cur, cached=True)
 
         # Get creation SQL statements for all objects
         create_statements = get_database_schema(cursor=src_cur, db_name=db_name, tables=tables)
@@ -204,15 +466,12 @@ def migrate_schema(db_name: str) -> List[str]:
         # Create each table in the destination database
         for table in tables:
             try:
-                dst_cur.execute(create_statements[table])
+                dst_cur.execute(create_statements[table][1])
             except mysql.connector.Error as ex:
                 if ex.errno != errorcode.ER_TABLE_EXISTS_ERROR:
                     raise ex
 
-        # Re-enable foreign key checks on destination database
-        change_keys_status(cursor=dst_cur, enabled=True)
-
-        # Close all database connections and cursors
+        # Close all database connections and cursors. Every borrower sets the key checks it needs (see connect)
         close_handlers(src_cur, dst_cur, src_conn, dst_conn)
 
         # Return the list of migrated tables
@@ -232,6 +491,10 @@ def migrate_schema(db_name: str) -> List[str]:
         raise ex
 
 
+# Object kinds created by migrate_procedures
+routine_kinds = frozenset({'TRIGGER', 'PROCEDURE', 'FUNCTION'})
+
+
 def migrate_procedures(db_name: str) -> bool:
     """
     Migrates stored procedures, functions, and triggers from the source database to the destination.
@@ -241,30 +504,21 @@ def migrate_procedures(db_name: str) -> bool:
     """
     try:
         # Establish connections to source and destination databases
-        src_cur, dst_cur, src_conn, dst_conn = connect(set_session_vars=True, src_db=db_name)
-
-        # Select database
-        dst_cur.execute(f"USE `{db_name}`")
-
-        # Disable foreign key checks on destination database
-        change_keys_status(cursor=dst_cur, enabled=False)
+        src_cur, dst_cur, src_conn, dst_conn = connect(set_session_vars=True, src_db=db_name, dst_db=db_name, key_checks=False)
 
         # Get creation SQL statements for procedures, functions, and triggers
         create_statements = get_database_schema(src_cur, db_name, None)
 
         # Execute each statement related to triggers, procedures, and functions
-        for _, statement in create_statements.items():
-            if any(keyword in statement for keyword in ["TRIGGER", "PROCEDURE", "FUNCTION"]):
+        for kind, statement in create_statements.values():
+            if kind in routine_kinds:
                 try:
                     dst_cur.execute(statement)
                 except mysql.connector.Error as ex:
                     if ex.errno != errorcode.ER_TABLE_EXISTS_ERROR:
                         raise ex
 
-        # Re-enable foreign key checks on destination database
-        change_keys_status(cursor=dst_cur, enabled=True)
-
-        # Close all database connections and cursors
+        # Close all database connections and cursors. Every borrower sets the key checks it needs (see connect)
         close_handlers(src_cur, dst_cur, src_conn, dst_conn)
 
         # Return True to indicate success
@@ -284,6 +538,102 @@ def migrate_procedures(db_name: str) -> bool:
         return False
 
 
+# Cores of the database and table workers when threads are pinned (--pin-threads). None: not pinned
+database_worker_cores: Optional[List[int]] = None
+table_worker_cores: Optional[List[int]] = None
+
+# Round-robin counters handing out the cores above
+database_worker_counter = itertools.count()
+table_worker_counter = itertools.count()
+
+
+def set_thread_pinning(db_thcount: int) -> bool:
+    """
+    Enables CPU pinning of worker threads. Database workers get the first usable cores (left to right)
+    and table workers the remaining ones, or all of them if there are not enough cores.
+
+    :param db_thcount: Number of database workers.
+    :return: True if pinning is supported (Linux), False otherwise.
+    """
+    global database_worker_cores, table_worker_cores
+
+    if not hasattr(os, 'sched_setaffinity'):
+        return False
+
+    cores = sorted(os.sched_getaffinity(0))
+    database_worker_cores = cores[:db_thcount]
+    table_worker_cores = cores[db_thcount:] or cores
+    return True
+
+
+def pin_worker_thread(cores: Optional[List[int]], counter: itertools.count) -> None:
+    """
+    Pins the calling thread to the next core of a list. Threads it starts later (shards, readers) inherit its affinity.
+
+    :param cores: The cores to pick from. Nothing is done if None or empty.
+    :param counter: The round-robin counter of the cores.
+    :return: None
+    """
+    if not cores:
+        return
+
+    # On Linux, pid 0 means the calling thread
+    try:
+        os.sched_setaffinity(0, {cores[next(counter) % len(cores)]})
+    except OSError:
+        pass
+
+
+def pin_database_worker() -> None:
+    """
+    Database thread pool initializer. Pins the new worker if thread pinning is enabled.
+
+    :return: None
+    """
+    pin_worker_thread(database_worker_cores, database_worker_counter)
+
+
+def pin_table_worker() -> None:
+    """
+    Table thread pool initializer. Pins the new worker if thread pinning is enabled.
+
+    :return: None
+    """
+    pin_worker_thread(table_worker_cores, table_worker_counter)
+
+
+def init_database_process(pool_size: int, pinned_db_thcount: Optional[int] = None, bulk_transfer: bool = False) -> None:
+    """
+    Worker process initializer (--process-pool). Worker processes are spawned, so the module state
+    set up by the main process (pool sizes, thread pinning, bulk transfer) must be set again.
+
+    :param pool_size: Size of the connection pools of the process.
+    :param pinned_db_thcount: Number of database workers if threads are pinned to cores, None otherwise.
+    :param bulk_transfer: Whether table data is loaded through LOAD DATA LOCAL INFILE.
+    :return: None
+    """
+    set_connection_pool_size(pool_size)
+    if bulk_transfer:
+        config.load_data_local_infile = True
+    if pinned_db_thcount:
+        set_thread_pinning(pinned_db_thcount)
+
+
+def migrate_database_process(db_name: str, args: Dict) -> None:
+    """
+    Runs migrate_database in a worker process (--process-pool). Worker processes exit without
+    running atexit handlers, so queued log messages are written before returning.
+
+    :param db_name: The name of the database to migrate.
+    :param args: The migration arguments.
+    :return: None
+    """
+    try:
+        migrate_database(db_name, args)
+    finally:
+        flush_logs()
+
+
 def migrate_database(db_name: str, args: Dict) -> None:
     """
     Migrates an entire database including schema, tables, and procedures.
@@ -331,69 +681,266 @@ def migrate_database_tables(db_name: str, tables: List[str], args: Dict) -> None
         return
 
     # Establish connections to source and destination databases
+    src_cur, dst_cur, src_conn, dst_conn = connect(set_session_vars=True, src_db=db_name, dst_db=db_name, key_checks=False)
+
+    try:
+        # DISABLE/ENABLE KEYS does nothing on InnoDB, so only send it for other engines (MyISAM...)
+        dst_cur.execute("SELECT TABLE_NAME FROM information_schema.TABLES WHERE TABLE_SCHEMA = %s AND TABLE_TYPE = 'BASE TABLE' AND ENGINE <> 'InnoDB'", (db_name,))
+        keyed_tables = set(tables).intersection(row[0] for row in dst_cur.fetchall())
+
+        # Estimated row counts, to copy small tables in a single statement
+        row_estimates = get_table_row_estimates(db_name, src_cur)
+
+        # Queries verifying the row count of every table, built at once
+        count_queries = get_count_queries(db_name, tables, src_cur)
+
+        # Disable keys for all tables before migration
+        execute_statements(dst_cur, [f"ALTER TABLE {escape_column_name(table)} DISABLE KEYS" for table in keyed_tables])
+
+        # Process tables in groups of args.table_thcount. Every worker uses its own connections
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(table_count, args.table_thcount), thread_name_prefix='mysql-migrator-table',
+                                                   initializer=pin_table_worker) as executor:
+            futures = {}
+
+            # Submit each table migration as a separate thread
+            for table_name in tables:
+                futures[executor.submit(migrate_table_worker, db_name, table_name, args.batch_size, args.shards,
+                                        row_estimates.get(table_name), count_queries[table_name])] = table_name
+
+            # Wait for all threads to complete
+            for future in concurrent.futures.as_completed(futures):
+                result, ex = future.result()
+
+                # Raise an exception indicating failure
+                if not result:
+                    raise Exception(f"Failed to migrate table `{futures[future]}` for database `{db_name}`: {ex}")
+
+        # Re-enable keys for all tables after migration
+        execute_statements(dst_cur, [f"ALTER TABLE {escape_column_name(table)} ENABLE KEYS" for table in keyed_tables])
+    finally:
+        # Close all database connections and cursors
+        close_handlers(src_cur=src_cur, dst_cur=dst_cur, src_conn=src_conn, dst_conn=dst_conn)
+
+
+def migrate_table_worker(db_name: str, table_name: str, batch_size: int, shards: int = 1, row_estimate: Optional[int] = None,
+                         count_query: Optional[str] = None) -> Tuple[bool, Exception]:
+    """
+    Migrates the data of a single table using its own source and destination connections,
+    so table workers never share a connection. Data is committed once the table is verified.
+
+    Big tables can be split in key ranges (shards) copied in parallel, every one with its own
+    connections and transaction. Shards are committed as they finish and the table is verified at the end.
+
+    :param db_name: The name of the database.
+    :param table_name: The name of the table to migrate.
+    :param batch_size: Initial batch size for row migration.
+    :param shards: Maximum number of key ranges copied in parallel.
+    :param row_estimate: Estimated number of rows (information_schema), if known.
+    :param count_query: The query verifying the table row count (see get_count_queries), if known.
+    :return: A tuple with the migration success status and any encountered exception.
+    """
+    # Empty and small tables are copied with a single SELECT, without progress bar
+    if row_estimate is not None and row_estimate < batch_size * 2:
+        result = migrate_small_table(db_name, table_name, batch_size * 2, count_query)
+        if result is not None:
+            return result
+
+    # Split the table in key ranges
+    key_ranges = [(None, None)]
+    if shards > 1:
+        try:
+            key_ranges = get_table_key_ranges(db_name, table_name, shards, batch_size, row_estimate)
+        except Exception as ex:
+            return False, ex
+
+    # Not worth (or possible) to split it
+    if len(key_ranges) == 1:
+        return migrate_table_range(db_name, table_name, batch_size, verify=True, row_estimate=row_estimate, count_query=count_query)
+
+    # Copy every key range in its own thread
+    range_estimate = row_estimate // len(key_ranges) if row_estimate is not None else None
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(key_ranges), thread_name_prefix='mysql-migrator-shard') as executor:
+        futures = [executor.submit(migrate_table_range, db_name, table_name, batch_size, lower_key, upper_key, False, range_estimate)
+                   for lower_key, upper_key in key_ranges]
+        results = [future.result() for future in futures]
+
+    # Any shard failed?
+    for result, ex in results:
+        if not result:
+            return False, ex
+
+    # Verify the whole table
     src_cur, dst_cur, src_conn, dst_conn = connect(set_session_vars=True, src_db=db_name, dst_db=db_name)
+    try:
+        if not migration_success(db_name=db_name, table_name=table_name, src_cur=src_cur, dst_cur=dst_cur, count_query=count_query):
+            return False, Exception("Row count mismatch between source and destination")
+        return True, None
+    except Exception as ex:
+        return False, ex
+    finally:
+        close_handlers(src_cur=src_cur, dst_cur=dst_cur, src_conn=src_conn, dst_conn=dst_conn)
+
+
+def migrate_small_table(db_name: str, table_name: str, max_rows: int, count_query: Optional[str] = None) -> Optional[Tuple[bool, Exception]]:
+    """
+    Migrates a table with a single SELECT and INSERT, skipping the batch loop, progress bar and key
+    bookkeeping. Row estimates may be wrong, so the table is only copied if it has at most max_rows rows.
+
+    :param db_name: The name of the database.
+    :param table_name: The name of the table to migrate.
+    :param max_rows: Maximum number of rows to copy this way.
+    :param count_query: The query verifying the table row count (see get_count_queries), if known.
+    :return: A tuple with the migration success status and any encountered exception, or None if the
+             table has more than max_rows rows and must be migrated as usual.
+    """
+    # Establish connections to source and destination databases
+    src_cur, dst_cur, src_conn, dst_conn = connect(set_session_vars=True, src_db=db_name, dst_db=db_name, key_checks=False)
+
+    try:
+        # Read the whole table (one more row tells us the estimate was wrong)
+        src_cur.execute(f"SELECT SQL_NO_CACHE * FROM {escape_column_name(table_name)} LIMIT {max_rows + 1}")
+        rows = src_cur.fetchall()
+
+        # Bigger than expected
+        if len(rows) > max_rows:
+            return None
 
-    # Disable foreign key checks on the destination
-    change_keys_status(cursor=dst_cur, enabled=False)
+        # Empty tables have nothing to copy, but are checked like the others
+        if rows:
+            # Get tables description
+            columns = src_cur.description
+            column_names = [escape_column_name(column[0]) for column in columns]
 
-    # Disable keys for all tables before migration
-    for table in tables:
-        dst_cur.execute(f"ALTER TABLE `{table}` DISABLE KEYS")
+            # Escape the rows
+            converters = get_column_converters(columns)
+            batch_resolved = resolve_batch(rows, converters) if any(converter is not None for converter in converters) else rows
 
-    # Start a new transaction with READ UNCOMMITTED isolation level
-    dst_conn.start_transaction(isolation_level='READ UNCOMMITTED', readonly=False)
+            # Insert the rows in a single transaction (key checks were disabled by connect)
+            dst_conn.start_transaction(isolation_level='READ UNCOMMITTED', readonly=False)
 
-    # Flag to track process success
-    process_success = True
+            if config.load_data_local_infile:
+                load_data_rows(dst_cur, table_name, column_names, batch_resolved, columns)
+            else:
+                # Keep INSERT statements well under the destination max_allowed_packet
+                dst_cur.execute("SELECT @@max_allowed_packet")
+                max_statement_size = dst_cur.fetchone()[0] // 2
 
-    # Process tables in groups of args.table_thcount
-    with concurrent.futures.ThreadPoolExecutor(max_workers=(args.table_thcount), thread_name_prefix='mysql-migrator-table') as executor:
-        futures = []
+                insert_prefix = f"INSERT INTO {escape_column_name(table_name)} ({', '.join(column_names)}) VALUES "
+                values_placeholder = f"({', '.join(['%s'] * len(column_names))})"
+                statements = PreparedInserts(dst_conn, insert_prefix, values_placeholder, len(column_names))
+                try:
+                    insert_rows(statements, batch_resolved, max_statement_size)
+                except mysql.connector.Error as ex:
+                    # 1062 = Primary key already exists; 1064 (42000): You have an error in your SQL syntax;
+                    if ex.errno != 1062 and ex.errno != 1064:
+                        raise
+                    on_error_insert_single(rows, f"{insert_prefix}{values_placeholder}", table_name, db_name, columns, dst_cur, None)
+                finally:
+                    statements.close()
+
+        # Check the row count before committing. LOAD DATA LOCAL skips bad rows with just a warning
+        if not migration_success(db_name=db_name, table_name=table_name, src_cur=src_cur, dst_cur=dst_cur, count_query=count_query):
+            dst_conn.rollback()
+            return False, Exception("Row count mismatch between source and destination")
+
+        # Commit table data
+        dst_conn.commit()
+        return True, None
+    except Exception as ex:
+        return False, ex
+    finally:
+        # Close all database connections and cursors
+        close_handlers(src_cur=src_cur, dst_cur=dst_cur, src_conn=src_conn, dst_conn=dst_conn)
 
-        # Submit each database migration as a separate thread
-        for table_name in tables:
-            # Push task to the thread pool
-            futures.append(executor.submit(lambda src_cur=src_cur, dst_cur=dst_cur, src_conn=src_conn, dst_conn=dst_conn, db_name=db_name, table_name=table_name, original_batch_size=args.batch_size:
-                           (db_name, table_name, src_cur, dst_cur, migrate_table_data(src_cur=src_cur, dst_cur=dst_cur, src_conn=src_conn, dst_conn=dst_conn, db_name=db_name, table_name=table_name, original_batch_size=original_batch_size))))
 
-        # Wait for all threads to complete
-        for future in concurrent.futures.as_completed(futures):
-            # Wait for
-            db_name, table_name, src_cur, dst_cur, (result, ex, progress) = future.result()
+def migrate_table_range(db_name: str, table_name: str, batch_size: int, lower_key: Optional[Tuple] = None,
+                        upper_key: Optional[Tuple] = None, verify: bool = True, row_estimate: Optional[int] = None,
+                        count_query: Optional[str] = None) -> Tuple[bool, Exception]:
+    """
+    Migrates the rows of a table (or of a key range of it) in a single transaction, using its own
+    source and destination connections.
 
-            # Show messaage and close progress
-            update_pbar(progress=progress, number=0, message=f"[{Fore.BLACK}{Back.LIGHTMAGENTA_EX}finishing{Style.RESET_ALL}] {db_name}.{table_name}{Style.RESET_ALL}", prompt=PbarPrompts.PERCENT_PROMPT)
+    :param db_name: The name of the database.
+    :param table_name: The name of the table to migrate.
+    :param batch_size: Initial batch size for row migration.
+    :param lower_key: Copy only rows after this key (exclusive). None for the beginning of the table.
+    :param upper_key: Copy only rows up to this key (inclusive). None for the end of the table.
+    :param verify: Whether to check the table row count before committing.
+    :param row_estimate: Estimated number of rows to copy, for the progress bar.
+    :param count_query: The query verifying the table row count (see get_count_queries), if known.
+    :return: A tuple with the migration success status and any encountered exception.
+    """
+    progress = None
 
-            # Success?
-            if not result or not migration_success(db_name=db_name, table_name=table_name, src_cur=src_cur, dst_cur=dst_cur):
-                # Mark the process as unsuccessful
-                process_success = False
+    # Establish connections to source and destination databases
+    src_cur, dst_cur, src_conn, dst_conn = connect(set_session_vars=True, src_db=db_name, dst_db=db_name, key_checks=False)
 
-                # Rollback the transaction
-                dst_conn.rollback()
+    try:
+        # Start a new transaction with READ UNCOMMITTED isolation level
+        dst_conn.start_transaction(isolation_level='READ UNCOMMITTED', readonly=False)
 
-                # Close bar
-                close_pbar(progress)
+        # Migrate table rows
+        result, ex, progress = migrate_table_data(src_cur=src_cur, dst_cur=dst_cur, src_conn=src_conn, dst_conn=dst_conn,
+                                                  db_name=db_name, table_name=table_name, original_batch_size=batch_size,
+                                                  lower_key=lower_key, upper_key=upper_key, row_estimate=row_estimate)
 
-                # Raise an exception indicating failure
-                raise Exception(f"Failed to migrate table `{table}` for database `{db_name}`: {ex}")
+        # Show finishing message
+        update_pbar(progress=progress, number=0, message=f"[{Fore.BLACK}{Back.LIGHTMAGENTA_EX}finishing{Style.RESET_ALL}] {db_name}.{table_name}{Style.RESET_ALL}", prompt=PbarPrompts.PERCENT_PROMPT)
 
-            # Close bar
-            close_pbar(progress)
+        # Success? Otherwise the transaction is rolled back when handlers are closed
+        if not result:
+            return False, ex
+        if verify and not migration_success(db_name=db_name, table_name=table_name, src_cur=src_cur, dst_cur=dst_cur, count_query=count_query):
+            return False, Exception("Row count mismatch between source and destination")
 
-    # If the process succeeded, commit the transaction
-    if process_success:
+        # Commit table data
         dst_conn.commit()
+        return True, None
+    except Exception as ex:
+        return False, ex
+    finally:
+        # Close bar and all database connections and cursors
+        close_pbar(progress)
+        close_handlers(src_cur=src_cur, dst_cur=dst_cur, src_conn=src_conn, dst_conn=dst_conn)
 
-    # Re-enable keys for all tables after migration
-    for table in tables:
-        dst_cur.execute(f"ALTER TABLE `{table}` ENABLE KEYS")
 
-    # Re-enable foreign key checks on the destination
-    change_keys_status(cursor=dst_cur, enabled=True)
+def get_table_key_ranges(db_name: str, table_name: str, shards: int, batch_size: int,
+                         row_estimate: Optional[int] = None) -> List[Tuple[Optional[Tuple], Optional[Tuple]]]:
+    """
+    Splits a table in key ranges with (roughly) the same number of rows. Tables without a usable
+    key, or with less than a few batches per range, are not split.
 
-    # Close all database connections and cursors
-    close_handlers(src_cur=src_cur, dst_cur=dst_cur, src_conn=src_conn, dst_conn=dst_conn)
+    :param db_name: The name of the database.
+    :param table_name: The name of the table.
+    :param shards: Maximum number of key ranges.
+    :param batch_size: Initial batch size for row migration.
+    :param row_estimate: Estimated number of rows, if known.
+    :return: A list of (lower_key, upper_key) tuples, as expected by migrate_table_range.
+    """
+    with get_src_conn() as (src_conn, src_cur):
+        # Only tables with a key can be split
+        key_columns = get_table_key_columns(db_name, table_name, src_cur)
+        if not key_columns:
+            return [(None, None)]
+
+        # Every range should have a few batches at least. Estimates are good enough to split the table
+        row_count = row_estimate if row_estimate is not None else get_table_row_estimate(db_name, table_name, src_cur)
+        shards = min(shards, row_count // (batch_size * 4))
+        if shards <= 1:
+            return [(None, None)]
+
+        # Range boundaries are the keys of the last row of every range
+        key_list = ', '.join([escape_column_name(column) for column in key_columns])
+        boundary_query = f"SELECT {key_list} FROM {escape_column_name(db_name)}.{escape_column_name(table_name)} ORDER BY {key_list} LIMIT 1 OFFSET %s"
+        boundaries = []
+        for shard in range(1, shards):
+            src_cur.execute(boundary_query, (row_count * shard // shards - 1,))
+            boundary = src_cur.fetchone()
+            if boundary is not None and (not boundaries or tuple(boundary) != boundaries[-1]):
+                boundaries.append(tuple(boundary))
+
+        # Build the ranges: (None, b1], (b1, b2], ..., (bn, None)
+        return list(zip([None] + boundaries, boundaries + [None]))
 
 
 def migrate_table_data(
@@ -403,7 +950,10 @@ def migrate_table_data(
     dst_conn: CMySQLConnection,
     db_name: str,
     table_name: str,
-    original_batch_size: int
+    original_batch_size: int,
+    lower_key: Optional[Tuple] = None,
+    upper_key: Optional[Tuple] = None,
+    row_estimate: Optional[int] = None
 ) -> Tuple[bool, Exception, tqdm]:
     """
     Migrates data from a source table to a destination table, handling errors, progress, and adjusting batch sizes.
@@ -415,64 +965,61 @@ def migrate_table_data(
     :param db_name: Name of the database.
     :param table_name: Name of the table to migrate.
     :param original_batch_size: Initial batch size for row migration.
+    :param lower_key: Copy only rows after this key (exclusive). Tables without key are always fully copied.
+    :param upper_key: Copy only rows up to this key (inclusive).
+    :param row_estimate: Estimated number of rows to copy, only used as progress bar total.
 
     :return: A tuple with the migration success status and any encountered exception.
     """
-    # Get PK info
-    with db_lock:
-        pk = get_table_pk(db_name, table_name, src_cur)
-        pk_count = get_table_pk_count(db_name, table_name, src_cur)
-
-        # Get PK count (may be *)
-        row_count_query = f"SELECT COUNT({pk}) FROM `{table_name}`"
-        src_cur.execute(row_count_query)
-        row_count = src_cur.fetchone()[0]
-
-        # Return if 0 rows
-        if row_count == 0:
-            return True, None, None
-
-        # Get first PK value
-        first_pk = 0
-        if pk != '*' and pk_count == 1:
-            src_cur.execute(f"SELECT {pk} FROM `{table_name}` ORDER BY {pk} ASC LIMIT 1")
-            first_pk = src_cur.fetchone()[0]
-
-        # Get table columns
-        src_cur.execute(f"SELECT * FROM `{table_name}` LIMIT 1")
-        rows = src_cur.fetchone()[0]
-
-        # Get tables description
-        column_names = [escape_column_name(i[0]) for i in src_cur.description]
-        columns = src_cur.description
-
-        # Generate a good batch_size
-        batch_size = original_batch_size
-        has_long_columns = False
-
-        # Set primary key index if there is a valid primary key and it is a single-column PK
-        if pk != '*' and pk_count == 1:
-            pk_index = column_names.index(pk)
-
-            # Define a set of valid numerical primary key types for clarity
-            valid_pk_types = {
-                mysql.connector.constants.FieldType.BIT,
-                mysql.connector.constants.FieldType.DOUBLE,
-                mysql.connector.constants.FieldType.ENUM,
-                mysql.connector.constants.FieldType.FLOAT,
-                mysql.connector.constants.FieldType.INT24,
-                mysql.connector.constants.FieldType.LONG,
-                mysql.connector.constants.FieldType.LONGLONG,
-                mysql.connector.constants.FieldType.SHORT,
-                mysql.connector.constants.FieldType.TINY,
-                mysql.connector.constants.FieldType.YEAR
-            }
-
-            # If the primary key is not one of the valid types, mark it as '*'
-            if columns[pk_index][1] not in valid_pk_types:
-                pk = '*'
-        else:
-            pk_index = 0
+    # Get the key (primary or unique) used to paginate the table. Without it, OFFSET is used
+    key_columns = get_table_key_columns(db_name, table_name, src_cur)
+    key_list = ', '.join([escape_column_name(column) for column in key_columns])
+    keyset_condition = build_keyset_condition(key_columns)
+
+    # Copy only the requested key range
+    if not key_columns:
+        lower_key = upper_key = None
+
+    # Estimated row count, only for the progress bar: counting rows would scan the whole table.
+    # The end of the table is detected when the stream runs out of rows
+    row_count = row_estimate if row_estimate is not None else get_table_row_estimate(db_name, table_name, src_cur)
+
+    # Key info shown in the progress bar
+    pk = escape_column_name(key_columns[0]) if len(key_columns) == 1 else '*'
+    pk_count = len(key_columns)
+
+    # Get table columns
+    src_cur.execute(f"SELECT * FROM {escape_column_name(table_name)} LIMIT 0")
+    src_cur.fetchall()
+
+    # Get tables description
+    column_names = [escape_column_name(i[0]) for i in src_cur.description]
+    columns = src_cur.description
+
+    # Pick the escaping function of every column once. Tables with only numeric columns skip escaping
+    converters = get_column_converters(columns)
+    needs_escaping = any(converter is not None for converter in converters)
+
+    # Position of key columns in every row
+    key_indexes = [column_names.index(escape_column_name(column)) for column in key_columns]
+
+    # Keep INSERT statements well under the destination max_allowed_packet
+    dst_cur.execute("SELECT @@max_allowed_packet")
+    max_statement_size = dst_cur.fetchone()[0] // 2
+
+    # Generate placeholders
+    values_placeholder = f"({', '.join(['%s'] * len(column_names))})"
+
+    # Generate INSERT query (multi-row prefix and single row version)
+    insert_prefix = f"INSERT INTO {escape_column_name(table_name)} ({', '.join(column_names)}) VALUES "
+    insert_query = f"{insert_prefix}{values_placeholder}"
+
+    # Multi-row INSERT statements are prepared once per row count and reused
+    statements = PreparedInserts(dst_conn, insert_prefix, values_placeholder, len(column_names))
+
+    # Generate a good batch_size
+    batch_size = original_batch_size
+    has_long_columns = False
 
     # Check if any column is of type MEDIUM_BLOB or LONG_BLOB, which may require batch size adjustments
     blob_types = {
@@ -487,29 +1034,32 @@ def migrate_table_data(
 
     # Some defaults
     calculated_batch_size = batch_size
-    increment_batch = 0
-    increment_batch_blocks = 0
+    batch_time = None
     boost = 2048
 
-    # Create and update progress
+    # Create and update progress. The bar is created with the first batch, empty tables and ranges have none
+    progress = None
     progress_created = False
 
     # Iterar sobre la tabla en bloques de tamaño batch_size
     offset = 0
-    while offset < row_count:
+    last_key = lower_key
+    reader = None
+
+    # Rows copied but not shown yet in the progress bar, which is only updated every progress_update_interval
+    pending_rows = 0
+    last_progress_update = 0.0
+    while True:
         # Get current tyme
         now = tm.time()
 
         try:
-            # Run SELECT statement
-            with db_lock:
-                if pk == '*' or pk_count != 1:
-                    src_cur.execute(f"SELECT SQL_NO_CACHE * FROM `{table_name}` LIMIT {batch_size} OFFSET {offset}")
-                else:
-                    src_cur.execute(f"SELECT SQL_NO_CACHE * FROM `{table_name}` WHERE {pk} >= {first_pk} ORDER BY {pk} ASC LIMIT {batch_size}")
+            # Stream the whole table with a single SELECT. It's only reopened after a connection loss
+            if reader is None:
+                reader = TableReader(src_conn, table_name, key_list, keyset_condition, last_key, offset, upper_key)
 
-                # Get rows
-                rows = src_cur.fetchall()
+            # Get rows (the next batch is read while this one is written)
+            rows = reader.fetch(batch_size)
 
             # No more rows? Quit
             if not rows:
@@ -518,47 +1068,46 @@ def migrate_table_data(
             # Is first time? Then create progress bar
             if not progress_created:
                 progress_created = True
-                progress = create_pbar(row_count, leave=False, colour=PbarColors.TABLE, units='row')
+                progress = create_pbar(max(row_count, len(rows)), leave=False, colour=PbarColors.TABLE, units='row')
+                progress.mininterval = progress_update_interval
                 update_pbar(progress=progress, colour="#cc745e", number=0, message=f"[{Fore.BLACK}{Back.WHITE}starting{Style.RESET_ALL}] {db_name}.{table_name}{Style.RESET_ALL}", prompt=PbarPrompts.PERCENT_PROMPT)
 
-            # Get next value
-            if pk != '*' and pk_count == 1:
-                first_pk = rows[len(rows) - 1][pk_index] + 1
-
-            # Generate placeholders
-            values_placeholder = ', '.join(['%s'] * len(column_names))
-
-            # Generate INSERT query
-            insert_query = f"INSERT INTO {escape_column_name(table_name)} ({', '.join(column_names)}) VALUES ({values_placeholder})"
-
             # Insert rows
-            with db_lock:
-                # Resolve batch
-                batch_resolved = [tuple(escape_value(value, columns, index, row) for index, value in enumerate(row)) for row in rows]
-
-                # Execute
-                dst_cur.executemany(insert_query, batch_resolved)
+            # Resolve batch
+            batch_resolved = resolve_batch(rows, converters) if needs_escaping else rows
 
-            # Increment countes
-            increment_batch = increment_batch + 1
+            # Execute as LOAD DATA or multi-row INSERT statements
+            if config.load_data_local_infile:
+                load_data_rows(dst_cur, table_name, column_names, batch_resolved, columns)
+            else:
+                insert_rows(statements, batch_resolved, max_statement_size)
 
-            # Time to boost?
-            if increment_batch == 10:
-                increment_batch_blocks = increment_batch_blocks + 1
-                batch_size = min(calculated_batch_size + (increment_batch_blocks * boost), batch_size * 6)
-                increment_batch = 0
         except mysql.connector.Error as ex:
             # 1062 = Primary key already exists; 1064 (42000): You have an error in your SQL syntax;
             if ex.errno == 1062 or ex.errno == 1064:
                 try:
                     on_error_insert_single(rows, insert_query, table_name, db_name, columns, dst_cur, progress)
                 except Exception as ex:
+                    close_table_reader(reader, abandon=True)
+                    statements.close()
                     return False, ex, progress
-            # 2013 Connection lost while querying
-            elif ex.errno == 2013:
+            # 2013 Connection lost while querying; 3024 Query execution was interrupted (MAX_EXECUTION_TIME)
+            elif ex.errno == 2013 or ex.errno == 3024:
                 try:
+                    # Prepared statements die with the connection
+                    reader = close_table_reader(reader)
+                    statements.close()
+
                     # Reconnect
-                    src_conn, dst_conn = reconnect_to_db(src_conn, dst_conn, src_cur, dst_cur, db_name)
+                    src_conn, dst_conn = reconnect_to_db(src_conn, dst_conn, src_cur, dst_cur, src_db=db_name, dst_db=db_name)
+
+                    # Data is only committed once the table (or range) is verified, so the rows copied so far were
+                    # rolled back with the lost connection. Copy the range again from its start
+                    last_key = lower_key
+                    offset = 0
+                    pending_rows = 0
+                    if progress:
+                        progress.reset(total=progress.total)
 
                     # Resize batch
                     batch_size = max(1, batch_size // 8)
@@ -566,14 +1115,23 @@ def migrate_table_data(
                     # Repeat batch
                     continue
                 except Exception as ex:
+                    close_table_reader(reader, abandon=True)
+                    statements.close()
                     return False, ex, progress
             else:
+                close_table_reader(reader, abandon=True)
+                statements.close()
                 return False, ex, progress
         except Exception as ex:
+            close_table_reader(reader, abandon=True)
+            statements.close()
             return False, ex, progress
 
-        # Increment offset
+        # Increment offset and remember the last key copied
         offset += len(rows)
+        if key_columns:
+            last_row = rows[-1]
+            last_key = tuple(last_row[index] for index in key_indexes)
 
         # Pick time
         later = tm.time()
@@ -581,64 +1139,562 @@ def migrate_table_data(
         # Calculate difference
         difference = round((later - now), 2)
 
-        # If it takes more than 4 seconds to execute, we reduce the batch size and alert (they were 16 and 20) (they were 4 and 8)
-        difference_info = ''
-        difference_color = Fore.WHITE
-        if difference > 4:
-            # Set prompt color
-            difference_color = Fore.RED
+        # Smooth batch times, so a single slow batch doesn't change the batch size
+        batch_time = difference if batch_time is None else (1 - batch_time_smoothing) * batch_time + batch_time_smoothing * difference
+
+        # Way slower than the target: the destination is overloaded. Reduce the batch size and give it some rest
+        if batch_time > batch_time_target * 4:
+            # Set prompt color
+            difference_color = Fore.RED
+
+            # Change batch size
+            batch_size = max(1, batch_size // 2)
+
+            # Calculate diff time
+            diff = min(batch_time // 4, 60)
+
+            # Update progress
+            update_pbar(progress=progress, colour="#cc745e", number=0, message=f"`{db_name}`.`{table_name}` {Fore.YELLOW}going to sleep for {diff}s{Style.RESET_ALL}", prompt=PbarPrompts.PERCENT_PROMPT)
+
+            # Sleep diff time and start measuring again
+            throttle(diff, progress)
+            batch_time = None
+        elif batch_time > batch_time_target * 2:
+            # Set prompt color
+            difference_color = Fore.YELLOW
+
+            # Change batch size
+            batch_size = max(1, batch_size // 2)
+        elif batch_time < batch_time_target / 2:
+            difference_color = Fore.GREEN
+
+            # Boost batch size
+            batch_size = min(batch_size + boost, calculated_batch_size * 6)
+        else:
+            difference_color = Fore.GREEN
+
+        # Building prompts and writing to the terminal is expensive, so only do it a few times per second
+        pending_rows += len(rows)
+        if later - last_progress_update < progress_update_interval:
+            continue
+        last_progress_update = later
+
+        # Generate differente info text
+        difference_info = f'{difference_color}{difference:.2f}s{Style.RESET_ALL}'
+
+        # Get prompt properties
+        colour, prompt = generate_progress_prompts(
+            batch_size=batch_size,
+            calculated_batch_size=calculated_batch_size,
+            pk=pk,
+            pk_count=pk_count,
+            db_name=db_name,
+            table_name=table_name,
+            difference_info=difference_info
+        )
+
+        # Estimates may be short, grow the progress bar total
+        if offset > progress.total:
+            progress.total = offset
+
+        # Update progress bar
+        update_pbar(progress=progress, number=pending_rows, colour=colour, message=prompt, prompt=PbarPrompts.PERCENT_PROMPT)
+        pending_rows = 0
+
+    # Show the rows copied since the last progress bar update
+    if pending_rows:
+        if offset > progress.total:
+            progress.total = offset
+        update_pbar(progress=progress, number=pending_rows, message=f"{db_name}.{table_name}", prompt=PbarPrompts.PERCENT_PROMPT)
+
+    # Release the source connection and the prepared statements
+    close_table_reader(reader)
+    statements.close()
+
+    # Return success
+    return True, None, progress
+
+
+def throttle(seconds: float, progress: tqdm) -> None:
+    """
+    Pauses the current worker, in short steps which keep its progress bar (elapsed time, rate) refreshed.
+
+    :param seconds: Time to sleep, in seconds.
+    :param progress: The progress bar of the worker, may be None.
+    :return: None
+    """
+    end = tm.monotonic() + seconds
+    while True:
+        remaining = end - tm.monotonic()
+        if remaining <= 0:
+            break
+
+        tm.sleep(min(progress_update_interval, remaining))
+        if progress:
+            progress.refresh()
+
+
+class TableReader:
+    """
+    Streams the rows of a table from a single unbuffered SELECT, ordered by its key if it has one.
+
+    The next batch is read ahead in a background thread while the current one is escaped and
+    written to the destination, so source reads and destination writes overlap. The C extension
+    releases the GIL while it waits for the network.
+    """
+
+    def __init__(self, src_conn: CMySQLConnection, table_name: str, key_list: str, keyset_condition: str,
+                 last_key: Optional[Tuple], offset: int, upper_key: Optional[Tuple] = None) -> None:
+        """
+        :param src_conn: Source database connection.
+        :param table_name: Name of the table to read.
+        :param key_list: The escaped key columns, comma separated. Empty if the table has no usable key.
+        :param keyset_condition: The condition returned by build_keyset_condition.
+        :param last_key: The key of the last copied row, to resume the stream after it.
+        :param offset: The number of copied rows, to resume the stream of tables without key.
+        :param upper_key: The key of the last row to read (inclusive). None to read up to the end.
+        """
+        self.cursor = src_conn.cursor(buffered=False)
+        self.connection_id = src_conn.connection_id
+        self.pending = None
+        self.executor = None
+        self.finished = False
+
+        query = f"SELECT SQL_NO_CACHE * FROM {escape_column_name(table_name)}"
+        if not key_list:
+            self.cursor.execute(f"{query} LIMIT 18446744073709551615 OFFSET %s" if offset else query, (offset,) if offset else None)
+        else:
+            range_condition, range_params = build_key_range_condition(keyset_condition, last_key, upper_key)
+            self.cursor.execute(f"{query}{range_condition} ORDER BY {key_list}", range_params or None)
+
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+    def fetch(self, batch_size: int) -> List[Tuple]:
+        """
+        Returns the next batch of rows and starts reading the following one.
+
+        :param batch_size: Number of rows to read.
+        :return: The rows, or an empty list at the end of the table.
+        """
+        # Take the batch read ahead, if any. Errors are raised here
+        if self.pending is not None:
+            pending, self.pending = self.pending, None
+            rows = pending.result()
+        else:
+            rows = self.cursor.fetchmany(batch_size)
+
+        # Read ahead the next batch
+        if rows:
+            self.pending = self.executor.submit(self.cursor.fetchmany, batch_size)
+        else:
+            self.finished = True
+
+        return rows
+
+    def close(self, abandon: bool = False) -> None:
+        """
+        Waits for the read ahead batch and closes the cursor, discarding any unread rows.
+
+        :param abandon: Whether the stream is left before its end (on errors). Closing the cursor reads
+                        every unread row (consume_results), so the SELECT is killed first.
+        :return: None
+        """
+        if abandon and not self.finished:
+            kill_query(self.connection_id)
+
+        if self.pending is not None:
+            concurrent.futures.wait([self.pending])
+            self.pending = None
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+
+        try:
+            self.cursor.close()
+        except mysql.connector.Error:
+            # The connection may be already lost
+            pass
+
+
+def close_table_reader(reader: Optional[TableReader], abandon: bool = False) -> None:
+    """
+    Closes a TableReader, if any.
+
+    :param reader: The reader, may be None.
+    :param abandon: Whether the stream is left before its end (see TableReader.close).
+    :return: None
+    """
+    if reader is not None:
+        reader.close(abandon)
+
+    return None
+
+
+def kill_query(connection_id: int) -> None:
+    """
+    Stops the statement running on a source connection, from another connection. Errors are ignored:
+    the statement may have finished or the connection may be already lost.
+
+    :param connection_id: The id of the source connection.
+    :return: None
+    """
+    try:
+        with get_src_conn() as (src_conn, src_cur):
+            src_cur.execute("KILL QUERY %s", (connection_id,))
+    except mysql.connector.Error:
+        pass
+
+
+def get_table_row_estimate(db_name: str, table_name: str, cursor: CMySQLCursorBuffered) -> int:
+    """
+    Retrieves the estimated row count of a table from its statistics, without scanning it.
+
+    :param db_name: The name of the database.
+    :param table_name: The name of the table.
+    :param cursor: A buffered MySQL cursor to execute the query.
+    :return: The estimated row count (0 if unknown).
+    """
+    cursor.execute("SELECT TABLE_ROWS FROM information_schema.TABLES WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s", (db_name, table_name))
+    row = cursor.fetchone()
+    return (row[0] or 0) if row else 0
+
+
+def get_table_row_estimates(db_name: str, cursor: CMySQLCursorBuffered) -> Dict[str, int]:
+    """
+    Retrieves the estimated row count of every table of a database with a single query.
+    Estimates come from table statistics and may be far from the real count.
+
+    :param db_name: The name of the database.
+    :param cursor: A buffered MySQL cursor to execute the query.
+    :return: A dictionary with the estimated row count of every table.
+    """
+    cursor.execute("SELECT TABLE_NAME, TABLE_ROWS FROM information_schema.TABLES WHERE TABLE_SCHEMA = %s AND TABLE_TYPE = 'BASE TABLE'", (db_name,))
+    return {table_name: table_rows or 0 for table_name, table_rows in cursor.fetchall()}
+
+
+def get_table_key_columns(database_name: str, table_name: str, cursor: CMySQLCursorBuffered) -> List[str]:
+    """
+    Retrieves the columns of the key used to paginate a table: the primary key or, if there is
+    none, the first unique index whose columns are all NOT NULL.
+
+    :param database_name: The name of the database containing the table.
+    :param table_name: The name of the table.
+    :param cursor: A buffered MySQL cursor to execute the query.
+    :return: The key column names in index order, or an empty list if the table has no usable key.
+    """
+    query = (
+        "SELECT INDEX_NAME, COLUMN_NAME, NULLABLE FROM information_schema.STATISTICS "
+        "WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s AND NON_UNIQUE = 0 "
+        "ORDER BY INDEX_NAME = 'PRIMARY' DESC, INDEX_NAME, SEQ_IN_INDEX"
+    )
+    cursor.execute(query, (database_name, table_name))
+
+    # Group columns by index, keeping the query order
+    indexes: Dict[str, List[Tuple[str, str]]] = {}
+    for index_name, column_name, nullable in cursor.fetchall():
+        indexes.setdefault(index_name, []).append((column_name, nullable))
+
+    # Pick the first index without nullable or functional (no column) parts
+    for index_columns in indexes.values():
+        if all(column_name and nullable != 'YES' for column_name, nullable in index_columns):
+            return [column_name for column_name, _ in index_columns]
+
+    return []
+
+
+def build_keyset_condition(key_columns: List[str]) -> str:
+    """
+    Builds the WHERE condition selecting rows after a given key, expanded as
+    k1 > %s OR (k1 = %s AND k2 > %s) ... so MySQL can use a range scan on the index.
+
+    :param key_columns: The key column names.
+    :return: The condition, with placeholders to bind using build_keyset_params.
+    """
+    names = [escape_column_name(column) for column in key_columns]
+    return ' OR '.join(
+        '(' + ' AND '.join([f"{name} = %s" for name in names[:index]] + [f"{names[index]} > %s"]) + ')'
+        for index in range(len(names))
+    )
+
+
+def build_keyset_params(last_key: Tuple) -> List[object]:
+    """
+    Builds the parameters for the condition generated by build_keyset_condition.
+
+    :param last_key: The key values of the last copied row.
+    :return: The list of parameters.
+    """
+    return [value for index in range(len(last_key)) for value in last_key[:index + 1]]
+
+
+def build_key_range_condition(keyset_condition: str, lower_key: Optional[Tuple], upper_key: Optional[Tuple]) -> Tuple[str, List[object]]:
+    """
+    Builds the WHERE clause selecting the rows after lower_key and up to upper_key (inclusive).
+
+    :param keyset_condition: The condition returned by build_keyset_condition.
+    :param lower_key: The lower key (exclusive), or None.
+    :param upper_key: The upper key (inclusive), or None.
+    :return: A tuple with the WHERE clause (empty if there are no bounds) and its parameters.
+    """
+    conditions = []
+    params = []
+
+    if lower_key is not None:
+        conditions.append(f"({keyset_condition})")
+        params.extend(build_keyset_params(lower_key))
+    if upper_key is not None:
+        conditions.append(f"NOT ({keyset_condition})")
+        params.extend(build_keyset_params(upper_key))
+
+    return (f" WHERE {' AND '.join(conditions)}" if conditions else ''), params
+
+
+def estimate_row_size(row: Tuple) -> int:
+    """
+    Estimates how many bytes a row takes once rendered inside an INSERT statement.
+
+    :param row: The row values.
+    :return: The estimated size in bytes.
+    """
+    # Strings and bytes may double their size when escaped, other values are short literals
+    return sum(2 * len(value) + 4 if isinstance(value, (str, bytes, bytearray)) else 24 for value in row)
+
+
+# Target time (seconds) of every batch. Batch sizes grow while batches are faster and shrink when they are slower
+batch_time_target = 1.0
+
+# Weight of the last batch time in the smoothed (EWMA) batch time
+batch_time_smoothing = 0.2
+
+# Minimum time (seconds) between progress bar updates of a table
+progress_update_interval = 0.25
+
+
+# Maximum number of placeholders in a prepared statement
+max_prepared_placeholders = 65535
+
+# Maximum number of prepared statements (distinct row counts) kept per table
+max_prepared_statements = 8
+
+
+class PreparedInserts:
+    """
+    Multi-row INSERT statements of a table, prepared on the destination server once per row count.
+    Full batches always have the same row count, so most of them reuse a prepared statement and
+    are sent using the binary protocol instead of being parsed again.
+    """
+
+    def __init__(self, dst_conn: CMySQLConnection, insert_prefix: str, values_placeholder: str, column_count: int) -> None:
+        """
+        :param dst_conn: Destination database connection.
+        :param insert_prefix: The INSERT statement up to the VALUES keyword.
+        :param values_placeholder: The placeholder for a single row, like '(%s, %s)'.
+        :param column_count: The number of columns of every row.
+        """
+        self.dst_conn = dst_conn
+        self.insert_prefix = insert_prefix
+        self.values_placeholder = values_placeholder
+        self.max_rows = max(1, max_prepared_placeholders // max(1, column_count))
+        self.cursors: Dict[int, object] = {}
+
+    def execute(self, rows: List[Tuple]) -> None:
+        """
+        Inserts the rows with a single statement.
+
+        :param rows: The rows to insert, at most max_rows.
+        :return: None
+        """
+        row_count = len(rows)
+        cursor = self.cursors.get(row_count)
+
+        # Prepare a new statement, discarding the oldest one if the cache is full
+        if cursor is None:
+            if len(self.cursors) >= max_prepared_statements:
+                self.close_cursor(self.cursors.pop(next(iter(self.cursors))))
+            cursor = self.dst_conn.cursor(prepared=True)
+            self.cursors[row_count] = cursor
+
+        cursor.execute(self.insert_prefix + ', '.join([self.values_placeholder] * row_count), [value for row in rows for value in row])
+
+    def close(self) -> None:
+        """
+        Deallocates every prepared statement.
+
+        :return: None
+        """
+        for cursor in self.cursors.values():
+            self.close_cursor(cursor)
+        self.cursors = {}
+
+    @staticmethod
+    def close_cursor(cursor: object) -> None:
+        """
+        Closes a prepared cursor, ignoring errors of lost connections.
+
+        :param cursor: The cursor.
+        :return: None
+        """
+        try:
+            cursor.close()
+        except mysql.connector.Error:
+            pass
+
+
+def insert_rows(statements: PreparedInserts, rows: List[Tuple], max_statement_size: int) -> None:
+    """
+    Inserts rows using multi-row INSERT statements, splitting them so no statement exceeds max_statement_size
+    bytes nor the placeholder limit of prepared statements.
+
+    :param statements: The prepared INSERT statements of the table.
+    :param rows: The rows to insert.
+    :param max_statement_size: The maximum size in bytes of each statement.
+    :return: None
+    """
+    chunk = []
+    chunk_size = len(statements.insert_prefix)
+
+    for row in rows:
+        row_size = estimate_row_size(row)
+
+        # Flush the current statement if this row doesn't fit in it
+        if chunk and (chunk_size + row_size > max_statement_size or len(chunk) == statements.max_rows):
+            statements.execute(chunk)
+            chunk = []
+            chunk_size = len(statements.insert_prefix)
+
+        chunk.append(row)
+        chunk_size += row_size
+
+    # Insert remaining rows
+    if chunk:
+        statements.execute(chunk)
+
+
+def format_load_data_value(value: object) -> bytes:
+    """
+    Formats a value as a field of a LOAD DATA file (tab separated, backslash escaped).
+
+    :param value: The value, already escaped by escape_value.
+    :return: The field bytes.
+    """
+    if value is None:
+        return b'\\N'
+    elif isinstance(value, (bytes, bytearray)):
+        # Binary values are written in hex and decoded with UNHEX() by the server
+        return value.hex().encode()
+    elif isinstance(value, timedelta):
+        # TIME columns come as timedelta, which str() would render like '1 day, 2:00:00'. Negative values keep
+        # a positive microseconds part, so split the whole value in microseconds
+        total_microseconds = value // timedelta(microseconds=1)
+        sign = '-' if total_microseconds < 0 else ''
+        secs, microseconds = divmod(abs(total_microseconds), 1000000)
+        hours, rest = divmod(secs, 3600)
+        minutes, secs = divmod(rest, 60)
+        return f"{sign}{hours:02}:{minutes:02}:{secs:02}.{microseconds:06}".encode()
+    elif isinstance(value, str):
+        return value.replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n').replace('\0', '\\0').encode()
+
+    return str(value).encode()
+
+
+def load_data_rows(dst_cur: CMySQLCursorBuffered, table_name: str, column_names: List[str], rows: List[Tuple], columns: List[Tuple]) -> None:
+    """
+    Loads rows into a table through LOAD DATA LOCAL INFILE, streamed through a named pipe in load_data_path
+    (or written in a temporary file there, if named pipes are not supported).
+
+    :param dst_cur: The cursor for the destination database.
+    :param table_name: The name of the table where data is being loaded.
+    :param column_names: The escaped column names.
+    :param rows: The rows to load.
+    :param columns: The column definitions of the table (cursor description).
+    :return: None
+    """
+    # Columns holding binary values are loaded through user variables and UNHEX(). BIT values come as integers,
+    # but LOAD DATA would store their digits as raw bytes, so they are cast through user variables too.
+    # Pooled sessions keep user variables, but every @vN read by the statement is assigned by it first
+    assignments = []
+    targets = []
+    for index, (name, column) in enumerate(zip(column_names, columns)):
+        if column[1] == mysql.connector.constants.FieldType.BIT:
+            targets.append(f"@v{index}")
+            assignments.append(f"{name} = CAST(@v{index} AS UNSIGNED)")
+        elif any(isinstance(row[index], (bytes, bytearray)) for row in rows):
+            targets.append(f"@v{index}")
+            assignments.append(f"{name} = UNHEX(@v{index})")
+        else:
+            targets.append(name)
 
-            # Change batch size
-            batch_size = max(1, batch_size // 2)
+    # Build the load statement
+    load_query = (f"LOAD DATA LOCAL INFILE %s INTO TABLE {escape_column_name(table_name)} CHARACTER SET utf8mb4 "
+                  f"FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' LINES TERMINATED BY '\\n' ({', '.join(targets)})")
+    if assignments:
+        load_query += f" SET {', '.join(assignments)}"
 
-            # Reset counters
-            increment_batch = 0
-            increment_batch_blocks = 0
+    # Without named pipes, write the rows in a temporary file and load it
+    if not hasattr(os, 'mkfifo'):
+        with tempfile.NamedTemporaryFile(mode='wb', dir=config.load_data_path, prefix='mysql-migrator-', suffix='.tsv', delete=False) as file:
+            write_load_data_rows(file, rows)
 
-            # Calculate diff time
-            diff = min(difference // 4, 60)
+        try:
+            dst_cur.execute(load_query, (file.name,))
+        finally:
+            os.remove(file.name)
+        return
 
-            # Update progress
-            update_pbar(progress=progress, colour="#cc745e", number=0, message=f"`{db_name}`.`{table_name}` {Fore.YELLOW}going to sleep for {diff}s{Style.RESET_ALL}", prompt=PbarPrompts.PERCENT_PROMPT)
+    # Stream the rows through a named pipe, so they are never written to disk
+    fifo_dir = tempfile.mkdtemp(dir=config.load_data_path, prefix='mysql-migrator-')
+    fifo_path = os.path.join(fifo_dir, 'rows.tsv')
+    os.mkfifo(fifo_path, 0o600)
+    writer = threading.Thread(target=stream_load_data_rows, args=(fifo_path, rows), daemon=True)
+    writer.start()
 
-            # Sleep diff time
-            tm.sleep(diff)
-        elif difference > 2:
-            # Set prompt color
-            difference_color = Fore.YELLOW
+    try:
+        dst_cur.execute(load_query, (fifo_path,))
+    finally:
+        # If the statement failed before reading the whole pipe, drain it so the writer can finish
+        if writer.is_alive():
+            fd = os.open(fifo_path, os.O_RDONLY | os.O_NONBLOCK)
+            try:
+                while writer.is_alive():
+                    try:
+                        os.read(fd, 65536)
+                    except BlockingIOError:
+                        pass
+                    writer.join(0.01)
+            finally:
+                os.close(fd)
 
-            # Substract from counters
-            increment_batch = max(0, increment_batch - 1)
-            increment_batch_blocks = max(0, increment_batch_blocks - 1)
+        writer.join()
+        os.remove(fifo_path)
+        os.rmdir(fifo_dir)
 
-            # Change batch size
-            batch_size = max(1, batch_size // 2)
-        else:
-            difference_color = Fore.GREEN
 
-        # Generate differente info text
-        difference_info = f'{difference_color}{difference:.2f}s{Style.RESET_ALL}'
+def write_load_data_rows(file, rows: List[Tuple]) -> None:
+    """
+    Writes rows in LOAD DATA format (tab separated fields, one row per line).
 
-        # Get prompt properties
-        colour, prompt = generate_progress_prompts(
-            batch_size=batch_size,
-            calculated_batch_size=calculated_batch_size,
-            pk=pk,
-            pk_count=pk_count,
-            db_name=db_name,
-            table_name=table_name,
-            difference_info=difference_info
-        )
+    :param file: A binary file object.
+    :param rows: The rows to write.
+    :return: None
+    """
+    for row in rows:
+        file.write(b'\t'.join([format_load_data_value(value) for value in row]))
+        file.write(b'\n')
 
-        # Update progress bar
-        update_pbar(progress=progress, number=len(rows), colour=colour, message=prompt, prompt=PbarPrompts.PERCENT_PROMPT)
 
-        # Finished? Don't refresh or sleep thread
-        if offset >= row_count:
-            break
+def stream_load_data_rows(fifo_path: str, rows: List[Tuple]) -> None:
+    """
+    Writes rows into the named pipe read by a LOAD DATA LOCAL INFILE statement. Runs in its own thread.
 
-    # Return success
-    return True, None, progress
+    :param fifo_path: Path of the named pipe.
+    :param rows: The rows to write.
+    :return: None
+    """
+    try:
+        with open(fifo_path, 'wb') as file:
+            write_load_data_rows(file, rows)
+    except BrokenPipeError:
+        # The reader went away, the statement failed and its error is raised by the caller
+        pass
 
 
 def on_error_insert_single(batch, insert_query: str, table_name: str, db_name: str, columns: str, dst_cur: CMySQLCursorBuffered, progress: tqdm) -> None:
@@ -655,20 +1711,22 @@ def on_error_insert_single(batch, insert_query: str, table_name: str, db_name: s
     :return: None
     """
     # Update progress bar to indicate the start of single row batch execution
-    progress.set_description(f"[{Fore.CYAN}%{Style.RESET_ALL}] "
-                             f"[{Fore.BLACK}{Back.LIGHTRED_EX}throttled{Style.RESET_ALL}] "
-                             f"{db_name}.{table_name} {Fore.RED}performing 1 row batches{Style.RESET_ALL}")
+    if progress:
+        progress.set_description(f"[{Fore.CYAN}%{Style.RESET_ALL}] "
+                                 f"[{Fore.BLACK}{Back.LIGHTRED_EX}throttled{Style.RESET_ALL}] "
+                                 f"{db_name}.{table_name} {Fore.RED}performing 1 row batches{Style.RESET_ALL}")
+
+    # Pick the escaping function of every column once
+    converters = get_column_converters(columns)
 
     # Iterate over each row in the batch and insert individually
     for row in batch:
         try:
-            with db_lock:
-                # Prepare each statement by escaping and formatting values
-                statement = tuple(escape_value(value=value, columns=columns, index=index, row=row)
-                                  for index, value in enumerate(row))
+            # Prepare each statement by escaping and formatting values
+            statement = tuple(value if converter is None else converter(value) for converter, value in zip(converters, row))
 
-                # Execute the insert query with the current row data
-                dst_cur.execute(insert_query, statement)
+            # Execute the insert query with the current row data
+            dst_cur.execute(insert_query, statement)
         except mysql.connector.Error as ex:
             # If there's a duplicate entry error (1062), continue to the next row
             if ex.errno == 1062:
@@ -687,7 +1745,7 @@ def migrate_grants(batch_size: int = 4096) -> None:
     """
     try:
         # Connect to the source and destination MySQL databases
-        src_cur, dst_cur, src_conn, dst_conn = connect(set_session_vars=True, src_db='mysql')
+        src_cur, dst_cur, src_conn, dst_conn = connect(set_session_vars=True, src_db='mysql', dst_db='mysql')
 
         # Begin a new transaction in the destination database
         dst_conn.start_transaction()
@@ -713,43 +1771,83 @@ def migrate_grants(batch_size: int = 4096) -> None:
         log_message(f"Error migrating GRANTS: {err}", LogType.ERROR)
 
 
-def get_all_tables(databases: List[str], cursor: CMySQLCursorBuffered, verbose: bool = False, skipped_databases: List[str] = None) -> List[str]:
+# Table names of every source database, filled by get_all_tables(cached=True). The source schema
+# doesn't change during a run, so the databases are listed once (inspection) and reused (schema migration)
+source_tables_cache: Dict[str, List[str]] = {}
+source_tables_cache_lock = threading.Lock()
+
+
+def clear_source_tables_cache() -> None:
+    """
+    Forgets the table names cached by get_all_tables, so they are read again from the server.
+
+    :return: None
     """
-    Retrieves all tables from the provided databases.
+    with source_tables_cache_lock:
+        source_tables_cache.clear()
+
+
+def get_all_tables(databases: List[str], cursor: CMySQLCursorBuffered, verbose: bool = False, skipped_databases: List[str] = None,
+                   cached: bool = False) -> List[str]:
+    """
+    Retrieves all tables from the provided databases with a single information_schema query.
 
     :param databases: A list of database names to scan for tables.
     :param cursor: A MySQL cursor to execute the queries.
     :param verbose: Whether to display progress of the scanning process. Defaults to False.
     :param skipped_databases: A list of databases to skip during the scanning process. Defaults to None.
+    :param cached: Whether to use (and fill) the source tables cache. Only for source cursors.
     :return: A list of table names found across the databases.
     """
-    tables = []
+    skipped = set(skipped_databases) if skipped_databases else set()
 
-    # If only one database is provided, scan it for tables
+    # A single database is always scanned. Otherwise, only migrable ones
     if len(databases) == 1:
-        if not skipped_databases or databases[0] not in skipped_databases:
-            cursor.execute(f"USE `{databases[0]}`")
-            cursor.execute(f"SHOW FULL TABLES IN `{databases[0]}` WHERE table_type LIKE 'BASE TABLE'")
-            tables += [table[0] for table in cursor.fetchall()]
+        scanned_databases = [db_name for db_name in databases if db_name not in skipped]
     else:
-        # Initialize progress bar if verbose is enabled
-        progress = tqdm(total=len(databases), leave=False, colour="#cc33ba", unit='table') if verbose else None
-
-        # Iterate over the list of databases
-        for db_name in databases:
-            if verbose:
-                progress.set_description(f"[{Fore.CYAN}%{Style.RESET_ALL}] Scanning tables for database `{db_name}`. {len(tables)} found so far")
-                progress.update(1)
-
-            # Check if the database is listed as migrable and not in the skipped list
-            if is_db_listed_as_migrable(db_name) and (not skipped_databases or db_name not in skipped_databases):
-                cursor.execute(f"USE `{db_name}`")
-                cursor.execute(f"SHOW FULL TABLES IN `{db_name}` WHERE table_type LIKE 'BASE TABLE'")
-                tables += [table[0] for table in cursor.fetchall()]
-
-        # Close the progress bar if it was used
-        if progress:
-            close_pbar(progress)
+        scanned_databases = [db_name for db_name in databases if is_db_listed_as_migrable(db_name) and db_name not in skipped]
+
+    if not scanned_databases:
+        return []
+
+    # Only query databases which are not cached yet
+    if cached:
+        with source_tables_cache_lock:
+            queried_databases = [db_name for db_name in scanned_databases if db_name not in source_tables_cache]
+            if not queried_databases:
+                return [table_name for db_name in scanned_databases for table_name in source_tables_cache[db_name]]
+    else:
+        queried_databases = scanned_databases
+
+    # Initialize progress bar if verbose is enabled
+    progress = create_pbar(len(databases), leave=False, colour=PbarColors.INFO, units='table') if verbose and len(databases) > 1 else None
+    update_pbar(progress=progress, number=0, message=f"Scanning tables for {len(scanned_databases)} databases", prompt=PbarPrompts.PERCENT_PROMPT)
+
+    # Get tables of every database at once, bucketed by database
+    cursor.execute(
+        "SELECT TABLE_SCHEMA, TABLE_NAME FROM information_schema.TABLES "
+        f"WHERE TABLE_TYPE = 'BASE TABLE' AND TABLE_SCHEMA IN ({', '.join(['%s'] * len(queried_databases))}) "
+        "ORDER BY TABLE_SCHEMA, TABLE_NAME",
+        tuple(queried_databases)
+    )
+    tables_by_database: Dict[str, List[str]] = {}
+    for db_name, table_name in cursor:
+        tables_by_database.setdefault(db_name, []).append(table_name)
+
+    # Cache the new databases (also the ones without tables) and merge the cached ones
+    if cached:
+        with source_tables_cache_lock:
+            for db_name in queried_databases:
+                source_tables_cache[db_name] = tables_by_database.get(db_name, [])
+            tables_by_database = {db_name: source_tables_cache[db_name] for db_name in scanned_databases}
+
+    # Keep the order of the databases list
+    tables = [table_name for db_name in scanned_databases for table_name in tables_by_database.get(db_name, [])]
+
+    # Close the progress bar if it was used
+    if progress:
+        progress.update(len(databases))
+        close_pbar(progress)
 
     return tables
 
@@ -761,8 +1859,17 @@ def get_process_dbs(cursor: CMySQLCursorBuffered) -> List[str]:
     :param cursor: A MySQL cursor to execute the database query.
     :return: A list of database names that are marked as migrable.
     """
-    cursor.execute("SHOW DATABASES")
-    dbs = [db[0] for db in cursor.fetchall() if is_db_listed_as_migrable(db[0])]
+    # Filter databases on the server side (same rules as is_db_listed_as_migrable, case sensitive)
+    query = "SELECT SCHEMA_NAME FROM information_schema.SCHEMATA WHERE CAST(SCHEMA_NAME AS BINARY) NOT IN ({})"
+    params = tuple(excluded_databases)
+    query = query.format(', '.join(['%s'] * len(params)))
+    if included_databases is not None:
+        query += f" AND CAST(SCHEMA_NAME AS BINARY) IN ({', '.join(['%s'] * len(included_databases))})"
+        params += tuple(included_databases)
+
+    # Build the list straight from the cursor rows
+    cursor.execute(query + " ORDER BY SCHEMA_NAME", params)
+    dbs = [db[0] for db in cursor]
     return dbs
 
 
@@ -780,10 +1887,20 @@ def close_handlers(src_cur: CMySQLCursorBuffered, dst_cur: CMySQLCursorBuffered,
         src_cur.close()
     if dst_cur:
         dst_cur.close()
-    if src_conn:
-        src_conn.close()
-    if dst_conn:
-        dst_conn.close()
+
+    # Pooled connections keep their session, so never hand back an open transaction
+    for conn in (src_conn, dst_conn):
+        if conn:
+            if conn.in_transaction:
+                conn.rollback()
+            conn.close()
+
+
+# Session timeouts and limits of every migration connection (MAX_EXECUTION_TIME is 2 hours in milliseconds)
+session_vars_query = (
+    "SET SESSION WAIT_TIMEOUT = 14400, MAX_EXECUTION_TIME = 7200000, net_read_timeout = 14400, "
+    "net_write_timeout = 14400, interactive_timeout = 14400"
+)
 
 
 def reconfigure_db_session(src_cur: CMySQLCursorBuffered, dst_cur: CMySQLCursorBuffered) -> None:
@@ -796,19 +1913,11 @@ def reconfigure_db_session(src_cur: CMySQLCursorBuffered, dst_cur: CMySQLCursorB
     """
     if src_cur:
         # Set session timeouts and limits for source database
-        src_cur.execute("SET SESSION WAIT_TIMEOUT = 14400")
-        src_cur.execute("SET SESSION MAX_EXECUTION_TIME = 7200000")  # 2 hours in milliseconds
-        src_cur.execute("SET SESSION net_read_timeout = 14400")
-        src_cur.execute("SET SESSION net_write_timeout = 14400")
-        src_cur.execute("SET SESSION interactive_timeout = 14400")
+        src_cur.execute(session_vars_query)
 
     if dst_cur:
         # Set session timeouts and limits for destination database
-        dst_cur.execute("SET SESSION WAIT_TIMEOUT = 14400")
-        dst_cur.execute("SET SESSION MAX_EXECUTION_TIME = 7200000")  # 2 hours in milliseconds
-        dst_cur.execute("SET SESSION net_read_timeout = 14400")
-        dst_cur.execute("SET SESSION net_write_timeout = 14400")
-        dst_cur.execute("SET SESSION interactive_timeout = 14400")
+        dst_cur.execute(session_vars_query)
 
 
 def reconnect_to_db(src_conn: CMySQLConnection, dst_conn: CMySQLConnection,
@@ -825,61 +1934,230 @@ def reconnect_to_db(src_conn: CMySQLConnection, dst_conn: CMySQLConnection,
     :param dst_db: The default destination database to use after reconnection, if provided.
     :return: A tuple containing the reconnected source and destination connection objects.
     """
-    with db_lock:
-        # Attempt to reconnect to both databases with retries
-        src_conn.reconnect(attempts=3, delay=5)
-        dst_conn.reconnect(attempts=3, delay=5)
+    # Attempt to reconnect to both databases with retries. Every thread owns its connections, so no lock is needed
+    src_conn.reconnect(attempts=3, delay=5)
+    dst_conn.reconnect(attempts=3, delay=5)
+
+    # Set destination connection to disable autocommit
+    dst_conn.autocommit = False
 
-        # Set destination connection to disable autocommit
-        dst_conn.autocommit = False
+    # Reconfigure session variables for both cursors
+    reconfigure_db_session(src_cur=src_cur, dst_cur=dst_cur)
+    mark_session_configured(src_conn)
+    mark_session_configured(dst_conn)
 
-        # Reconfigure session variables for both cursors
-        reconfigure_db_session(src_cur=src_cur, dst_cur=dst_cur)
+    # Use default databases if provided
+    if src_db:
+        src_cur.execute(f"USE {escape_column_name(src_db)}")
+    if dst_db:
+        dst_cur.execute(f"USE {escape_column_name(dst_db)}")
 
-        # Use default databases if provided
-        if src_db:
-            src_cur.execute(f"USE `{src_db}`")
-        if dst_db:
-            dst_cur.execute(f"USE `{dst_db}`")
+    # Only table data is copied after a reconnection, without key checks
+    change_keys_status(conn=dst_conn, cursor=dst_cur, enabled=False)
 
     # Return the reconnected connection objects
     return src_conn, dst_conn
 
 
-def connect(set_session_vars: bool = True, src_db: str = None, dst_db: str = None) -> Tuple[CMySQLCursorBuffered, CMySQLCursorBuffered, CMySQLConnection, CMySQLConnection]:
+# Connection pools, created on first use (one per pool_name). MySQLConnectionPool opens all its connections
+# when it's created, so the first connection of every side and process pays pool size handshakes
+connection_pools: Dict[str, MySQLConnectionPool] = {}
+connection_pools_lock = threading.Lock()
+
+# Pool size used when pools are created. If None, the pool_size of the config is used
+connection_pool_size = None
+
+
+def get_connection_pool_size(db_thcount: int, table_thcount: int, shards: int) -> int:
+    """
+    Computes the number of connections used at once (per side) by the database workers of a process.
+
+    :param db_thcount: Number of database workers.
+    :param table_thcount: Number of table workers of every database worker.
+    :param shards: Maximum number of key ranges copied in parallel for every table.
+    :return: The number of connections.
+    """
+    # Every database worker holds a pair while its tables are copied (migrate_database_tables), every table
+    # worker a pair per key range, and a short lived source connection may be opened to split a table or stop a query
+    return db_thcount * (1 + table_thcount * max(1, shards) + 1)
+
+
+def set_connection_pool_size(size: int) -> None:
+    """
+    Sets the size of the connection pools, usually from get_connection_pool_size. It must be called before
+    the first connection is opened; bigger sizes are capped to the connector limit (CNX_POOL_MAXSIZE), and
+    the connections over it are opened outside of the pools (see open_connection).
+
+    :param size: Number of connections kept by every pool.
+    :return: None
+    """
+    global connection_pool_size
+    connection_pool_size = max(1, min(size, CNX_POOL_MAXSIZE))
+
+
+def get_connection_pool(connection_config: dict) -> Optional[MySQLConnectionPool]:
+    """
+    Returns the connection pool of a config, creating it on first use.
+
+    :param connection_config: The connection arguments for mysql.connector, including pool_name.
+    :return: The pool, or None if the config doesn't ask for pooling.
+    """
+    pool_name = connection_config.get('pool_name')
+    if not pool_name:
+        return None
+
+    pool = connection_pools.get(pool_name)
+    if pool is None:
+        with connection_pools_lock:
+            pool = connection_pools.get(pool_name)
+            if pool is None:
+                pool = MySQLConnectionPool(
+                    pool_name=pool_name,
+                    pool_size=connection_pool_size or connection_config.get('pool_size', 5),
+                    pool_reset_session=connection_config.get('pool_reset_session', True),
+                    **{key: value for key, value in connection_config.items() if not key.startswith('pool_')}
+                )
+                connection_pools[pool_name] = pool
+
+    return pool
+
+
+def open_connection(connection_config: dict) -> CMySQLConnection:
+    """
+    Checks out a connection from the pool of the given config, so sockets are reused instead of paying
+    a full handshake for every connection. If the pool is exhausted, a dedicated (non pooled) connection
+    is opened instead. Closing a pooled connection returns it to its pool.
+
+    :param connection_config: The connection arguments for mysql.connector.
+    :return: The connection object.
+    """
+    pool = get_connection_pool(connection_config)
+    if pool is not None:
+        try:
+            return pool.get_connection()
+        except PoolError:
+            # Pool exhausted, don't fail but open a connection outside of it
+            pass
+
+    return mysql.connector.connect(**{key: value for key, value in connection_config.items() if not key.startswith('pool_')})
+
+
+def build_destination_config() -> dict:
+    """
+    Builds the destination connection arguments. Every destination connection uses them, so the
+    destination pool is always created with the same options, whoever opens the first connection.
+
+    :return: A new dict with the connection arguments.
+    """
+    dst_config = build_config(destination_config)
+
+    # Destination may read LOAD DATA files, but only from load_data_path
+    if config.load_data_local_infile:
+        dst_config['allow_local_infile_in_path'] = config.load_data_path
+
+    return dst_config
+
+
+@contextmanager
+def get_src_conn() -> Iterator[Tuple[CMySQLConnection, CMySQLCursorBuffered]]:
+    """
+    Checks out a source connection (see open_connection) with a buffered cursor, and hands it back
+    to the pool on exit. Open transactions are rolled back.
+
+    :return: A context manager yielding the connection and its cursor.
+    """
+    conn = open_connection(build_config(source_config))
+    cursor = conn.cursor(buffered=True)
+    try:
+        yield conn, cursor
+    finally:
+        close_handlers(None, cursor, None, conn)
+
+
+@contextmanager
+def get_dst_conn() -> Iterator[Tuple[CMySQLConnection, CMySQLCursorBuffered]]:
+    """
+    Checks out a destination connection (see open_connection) with a buffered cursor, and hands it
+    back to the pool on exit. Open transactions are rolled back.
+
+    :return: A context manager yielding the connection and its cursor.
+    """
+    conn = open_connection(build_destination_config())
+    cursor = conn.cursor(buffered=True)
+    try:
+        # Pooled sessions may come with key checks disabled by a previous borrower
+        change_keys_status(conn=conn, cursor=cursor, enabled=True)
+        yield conn, cursor
+    finally:
+        close_handlers(None, cursor, None, conn)
+
+
+def connect(set_session_vars: bool = True, src_db: str = None, dst_db: str = None,
+            key_checks: bool = True) -> Tuple[CMySQLCursorBuffered, CMySQLCursorBuffered, CMySQLConnection, CMySQLConnection]:
     """
     Establishes connections to both source and destination databases and returns the corresponding cursors and connections.
 
     :param set_session_vars: Whether to set session variables for the connections.
     :param src_db: The source database to connect to, if provided.
     :param dst_db: The destination database to connect to, if provided.
+    :param key_checks: Whether unique and foreign key checks are enabled on the destination. Only
+                       the sessions copying schemas and table data disable them.
     :return: A tuple containing source cursor, destination cursor, source connection, and destination connection.
     """
     # Establish connections to source and destination databases
-    src_conn = mysql.connector.connect(**source_config)
-    dst_conn = mysql.connector.connect(**destination_config)
+    src_conn = open_connection(build_config(source_config))
+    dst_conn = open_connection(build_destination_config())
 
     # Create cursors for both connections
     src_cur = src_conn.cursor(buffered=True)
     dst_cur = dst_conn.cursor(buffered=True)
 
-    # Disable autocommit for the destination connection
-    dst_conn.autocommit = False
-
-    # Use default databases if provided
+    # Use default databases if provided (autocommit is already disabled by destination_config)
     if src_db:
-        src_cur.execute(f"USE `{src_db}`")
+        src_cur.execute(f"USE {escape_column_name(src_db)}")
     if dst_db:
-        dst_cur.execute(f"USE `{dst_db}`")
+        dst_cur.execute(f"USE {escape_column_name(dst_db)}")
 
-    # Set session variables if required
+    # Set session variables if required. Pooled connections keep them, so only configure new sessions
     if set_session_vars:
-        reconfigure_db_session(src_cur=src_cur, dst_cur=dst_cur)
+        src_pending = not is_session_configured(src_conn)
+        dst_pending = not is_session_configured(dst_conn)
+        if src_pending or dst_pending:
+            reconfigure_db_session(src_cur=src_cur if src_pending else None, dst_cur=dst_cur if dst_pending else None)
+            mark_session_configured(src_conn)
+            mark_session_configured(dst_conn)
+
+    # Pooled sessions keep the key checks of the previous borrower, always set them
+    change_keys_status(conn=dst_conn, cursor=dst_cur, enabled=key_checks)
 
     # Return the cursors and connections
     return src_cur, dst_cur, src_conn, dst_conn
 
 
+def is_session_configured(conn: CMySQLConnection) -> bool:
+    """
+    Checks whether reconfigure_db_session already ran on the current session of a connection.
+    The flag is kept on the underlying connection, so it survives pool check-outs, and is tied to
+    the connection id, so reconnections invalidate it.
+
+    :param conn: The connection (pooled or not).
+    :return: True if the session is already configured.
+    """
+    cnx = getattr(conn, '_cnx', conn)
+    return getattr(cnx, 'migrator_session_id', None) == cnx.connection_id
+
+
+def mark_session_configured(conn: CMySQLConnection) -> None:
+    """
+    Flags the current session of a connection as configured by reconfigure_db_session.
+
+    :param conn: The connection (pooled or not).
+    :return: None
+    """
+    cnx = getattr(conn, '_cnx', conn)
+    cnx.migrator_session_id = cnx.connection_id
+
+
 def get_table_pk(database_name: str, table_name: str, cursor: CMySQLCursorBuffered) -> str:
     """
     Retrieves the primary key column name of a specified table in a database.
@@ -898,31 +2176,179 @@ def get_table_pk(database_name: str, table_name: str, cursor: CMySQLCursorBuffer
 
     if primary_keys:
         # Return the first primary key column name with backticks
-        return f"`{primary_keys[0][0]}`"
+        return escape_column_name(primary_keys[0][0])
     else:
         # Return '*' if no primary key exists
         return "*"
 
 
-def get_table_pk_count(database_name: str, table_name: str, cursor: CMySQLCursorBuffered) -> int:
+def get_table_pks(databases: List[str], cursor: CMySQLCursorBuffered) -> Dict[Tuple[str, str], str]:
     """
-    Counts the number of primary key columns in a specified table within a database.
+    Retrieves the primary key column of every table of the provided databases with a single query.
 
-    :param database_name: The name of the database containing the table.
-    :param table_name: The name of the table to count primary keys from.
+    :param databases: A list of database names.
     :param cursor: A buffered MySQL cursor to execute the query.
-    :return: The number of primary key columns in the table.
+    :return: A dictionary with the primary key column name, enclosed in backticks, of every (database, table)
+             with a primary key. Use '*' for missing tables, like get_table_pk does.
     """
+    if not databases:
+        return {}
+
     query = (
-        "SELECT COUNT(*) FROM information_schema.COLUMNS "
-        "WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s AND COLUMN_KEY = 'PRI'"
+        "SELECT TABLE_SCHEMA, TABLE_NAME, COLUMN_NAME FROM information_schema.COLUMNS "
+        f"WHERE COLUMN_KEY = 'PRI' AND TABLE_SCHEMA IN ({', '.join(['%s'] * len(databases))}) "
+        "ORDER BY ORDINAL_POSITION"
     )
-    cursor.execute(query, (database_name, table_name))
-    count = cursor.fetchone()[0]
-    return count
+    cursor.execute(query, tuple(databases))
+
+    # Keep the first primary key column of every table
+    primary_keys = {}
+    for db_name, table_name, column_name in cursor.fetchall():
+        primary_keys.setdefault((db_name, table_name), escape_column_name(column_name))
+
+    return primary_keys
+
+
+def build_count_query(db_name: str, table_name: str, pk: str = '*') -> str:
+    """
+    Builds the query counting the rows of a table, fully qualified so it runs from any default database.
+
+    :param db_name: The name of the database.
+    :param table_name: The name of the table.
+    :param pk: The primary key column to count on, as returned by get_table_pk(s), or '*'.
+    :return: The SELECT COUNT query.
+    """
+    return f"SELECT COUNT({pk}) FROM {escape_column_name(db_name)}.{escape_column_name(table_name)}"
+
+
+def get_count_queries(db_name: str, tables: List[str], cursor: CMySQLCursorBuffered) -> Dict[str, str]:
+    """
+    Builds the count query of every table of a database at once, so table checks don't look up
+    the primary key nor build the query again.
+
+    :param db_name: The name of the database.
+    :param tables: The names of the tables.
+    :param cursor: A buffered MySQL cursor to execute the query.
+    :return: A dictionary with the count query of every table.
+    """
+    primary_keys = get_table_pks([db_name], cursor)
+    return {table_name: build_count_query(db_name, table_name, primary_keys.get((db_name, table_name), '*')) for table_name in tables}
+
+
+# Engines whose TABLE_ROWS statistic is an exact row count, not an estimate
+exact_row_count_engines = frozenset({'MYISAM', 'MEMORY', 'ARIA'})
+
+
+def get_table_statistics(databases: List[str], cursor: CMySQLCursorBuffered) -> List[Tuple[str, str, str, Optional[int]]]:
+    """
+    Retrieves every table of the provided databases, with its engine and live row statistics, in a single query.
 
+    :param databases: A list of database names.
+    :param cursor: A buffered MySQL cursor to execute the queries.
+    :return: A list of (database, table, engine, table rows) tuples.
+    """
+    if not databases:
+        return []
+
+    # MySQL 8 caches table statistics. Read them live, so exact counts are not stale (older servers don't cache them)
+    live_statistics = True
+    try:
+        cursor.execute("SET SESSION information_schema_stats_expiry = 0")
+    except mysql.connector.Error as ex:
+        if ex.errno != errorcode.ER_UNKNOWN_SYSTEM_VARIABLE:
+            raise ex
+        live_statistics = False
+
+    try:
+        # Get every table, its engine and its statistics
+        cursor.execute(
+            "SELECT TABLE_SCHEMA, TABLE_NAME, ENGINE, TABLE_ROWS FROM information_schema.TABLES "
+            f"WHERE TABLE_TYPE = 'BASE TABLE' AND TABLE_SCHEMA IN ({', '.join(['%s'] * len(databases))})",
+            tuple(databases)
+        )
+        return cursor.fetchall()
+    finally:
+        # Pooled sessions are not reset, don't leave the setting to the next borrower
+        if live_statistics:
+            cursor.execute("SET SESSION information_schema_stats_expiry = DEFAULT")
+
+
+def get_row_counts_bulk(databases: List[str], cursor: CMySQLCursorBuffered, exact: bool = False,
+                        primary_keys: Dict[Tuple[str, str], str] = None,
+                        table_statistics: List[Tuple[str, str, str, Optional[int]]] = None) -> Dict[str, int]:
+    """
+    Retrieves the row count of every table of the provided databases. Estimates come from a single
+    information_schema query. Exact counts are read from the statistics for engines which keep an exact
+    row count (exact_row_count_engines) and pipeline one COUNT() per remaining table in multi-statement
+    queries (up to max_multi_statement_size each), instead of paying a round-trip per table.
+
+    :param databases: A list of database names.
+    :param cursor: A buffered MySQL cursor to execute the queries.
+    :param exact: Whether to count rows (slow on big tables) or use the table statistics estimate.
+    :param primary_keys: The primary keys returned by get_table_pks, to count on them. Loaded if not provided.
+    :param table_statistics: The tables of the databases returned by get_table_statistics. Loaded if not provided.
+    :return: A dictionary with the row count of every table, with 'database.table' keys.
+    """
+    if not databases:
+        return {}
+
+    # Estimates
+    if not exact:
+        cursor.execute(
+            "SELECT TABLE_SCHEMA, TABLE_NAME, TABLE_ROWS FROM information_schema.TABLES "
+            f"WHERE TABLE_TYPE = 'BASE TABLE' AND TABLE_SCHEMA IN ({', '.join(['%s'] * len(databases))})",
+            tuple(databases)
+        )
+        return {f"{db_name}.{table_name}": table_rows or 0 for db_name, table_name, table_rows in cursor.fetchall()}
+
+    if table_statistics is None:
+        table_statistics = get_table_statistics(databases, cursor)
+
+    row_counts = {}
+    tables = []
+    for db_name, table_name, engine, table_rows in table_statistics:
+        # Some engines keep an exact row count in the table statistics, so there is nothing to scan
+        if engine and engine.upper() in exact_row_count_engines and table_rows is not None:
+            row_counts[f"{db_name}.{table_name}"] = table_rows
+        else:
+            tables.append((db_name, table_name))
+
+    if not tables:
+        return row_counts
+
+    if primary_keys is None:
+        primary_keys = get_table_pks(databases, cursor)
+
+    batch = []
+    batch_size = 0
+
+    def flush() -> None:
+        # Result sets come back in the same order as the statements
+        cursor.execute(' '.join(statement for _, statement in batch))
+        for (key, _), (_, result) in zip(batch, cursor.fetchsets()):
+            row_counts[key] = result[0][0]
+
+    # Count tables in pipelined groups
+    for db_name, table_name in tables:
+        statement = build_count_query(db_name, table_name, primary_keys.get((db_name, table_name), '*')) + ";"
+
+        # Keep every query under the size limit
+        if batch and batch_size + len(statement) > max_multi_statement_size:
+            flush()
+            batch = []
+            batch_size = 0
 
-def migration_success(db_name: str, table_name: str, src_cur: CMySQLCursorBuffered, dst_cur: CMySQLCursorBuffered) -> bool:
+        batch.append((f"{db_name}.{table_name}", statement))
+        batch_size += len(statement)
+
+    if batch:
+        flush()
+
+    return row_counts
+
+
+def migration_success(db_name: str, table_name: str, src_cur: CMySQLCursorBuffered, dst_cur: CMySQLCursorBuffered,
+                      count_query: Optional[str] = None) -> bool:
     """
     Checks whether the migration of a table was successful by comparing the row counts
     between the source and destination databases.
@@ -931,41 +2357,43 @@ def migration_success(db_name: str, table_name: str, src_cur: CMySQLCursorBuffer
     :param table_name: The name of the table to check.
     :param src_cur: The source database cursor.
     :param dst_cur: The destination database cursor.
+    :param count_query: The count query of the table (see get_count_queries). Built if not provided.
     :return: True if the row counts match between the source and destination, False otherwise.
     """
-    with db_lock:
-        try:
-            src_sizes = {}
-            dst_sizes = {}
-
-            # Count rows in the source table
-            try:
-                src_cur.execute(f"USE `{db_name}`")
-                src_cur.execute(f"SELECT COUNT({get_table_pk(db_name, table_name, src_cur)}) FROM `{table_name}`")
-                src_sizes[f"{db_name}.{table_name}"] = src_cur.fetchone()[0]
-            except Exception as ex:
-                log_message(f"Error counting rows in source table `{table_name}`: {ex}", LogType.ERROR)
-                return False
-
-            # Count rows in the destination table
-            try:
-                dst_cur.execute(f"USE `{db_name}`")
-                dst_cur.execute(f"SELECT COUNT({get_table_pk(db_name, table_name, dst_cur)}) FROM `{table_name}`")
-                dst_sizes[f"{db_name}.{table_name}"] = dst_cur.fetchone()[0]
-            except Exception as ex:
-                log_message(f"Error counting rows in destination table `{table_name}`: {ex}", LogType.ERROR)
-                return False
+    try:
+        src_sizes = {}
+        dst_sizes = {}
 
-            # Compare row counts between source and destination
-            return src_sizes == dst_sizes
+        # Both tables share the same schema, so the same query counts both sides
+        if count_query is None:
+            count_query = build_count_query(db_name, table_name, get_table_pk(db_name, table_name, src_cur))
 
-        except mysql.connector.Error as ex:
-            log_message(f"Error checking migration status: {ex}", LogType.ERROR)
+        # Count rows in the source table
+        try:
+            src_cur.execute(count_query)
+            src_sizes[f"{db_name}.{table_name}"] = src_cur.fetchone()[0]
+        except Exception as ex:
+            log_message(f"Error counting rows in source table `{table_name}`: {ex}", LogType.ERROR)
             return False
+
+        # Count rows in the destination table
+        try:
+            dst_cur.execute(count_query)
+            dst_sizes[f"{db_name}.{table_name}"] = dst_cur.fetchone()[0]
         except Exception as ex:
-            log_message(f"Error checking migration status: {ex}", LogType.ERROR)
+            log_message(f"Error counting rows in destination table `{table_name}`: {ex}", LogType.ERROR)
             return False
 
+        # Compare row counts between source and destination
+        return src_sizes == dst_sizes
+
+    except mysql.connector.Error as ex:
+        log_message(f"Error checking migration status: {ex}", LogType.ERROR)
+        return False
+    except Exception as ex:
+        log_message(f"Error checking migration status: {ex}", LogType.ERROR)
+        return False
+
 
 def count_migration_rows(src_dbs: List[str]) -> int:
     """
@@ -980,25 +2408,37 @@ def count_migration_rows(src_dbs: List[str]) -> int:
         row_count = 0
 
         # Progress bar for tracking progress through databases
-        progress = tqdm(total=len(src_dbs), leave=False, colour="#cc1c91", unit='database')
+        progress = create_pbar(len(src_dbs), leave=False, colour=PbarColors.COUNT, units='database')
+
+        # Primary keys and tables of every database, loaded at once
+        primary_keys = get_table_pks(src_dbs, src_cur)
+        table_statistics = group_by_database(get_table_statistics(src_dbs, src_cur))
+
+        # Description template, built once. The bar is only updated every progress_update_interval
+        description = f"[{Fore.BLUE}%%{Style.RESET_ALL}] Counting rows in database `%s`..."
+        pending_dbs = 0
+        last_progress_update = 0.0
 
         # Loop through each source database
         for database in src_dbs:
-            progress.update(1)
+            pending_dbs += 1
+            now = tm.monotonic()
+            if now - last_progress_update >= progress_update_interval:
+                progress.set_description(description % database, refresh=False)
+                progress.update(pending_dbs)
+                pending_dbs = 0
+                last_progress_update = now
+
             try:
-                src_cur.execute(f"USE `{database}`")
-                src_tbls = get_all_tables([database], src_cur)
-
-                # Count rows for each table in the current database
-                for table in src_tbls:
-                    progress.set_description(f"[{Fore.BLUE}%{Style.RESET_ALL}] Counting rows in database `{database}`...")
-                    src_cur.execute(f"SELECT COUNT({get_table_pk(database, table, src_cur)}) FROM `{table}`")
-                    row_count += src_cur.fetchone()[0]
+                # Count rows for all tables in the current database
+                row_count += sum(get_row_counts_bulk([database], src_cur, exact=True, primary_keys=primary_keys,
+                                                     table_statistics=table_statistics.get(database, [])).values())
             except Exception as ex:
                 log_message(f"Error counting rows in database `{database}`: {ex}", LogType.WARNING)
                 continue
 
         # Close the progress bar and all database handlers
+        progress.update(pending_dbs)
         close_pbar(progress)
         close_handlers(src_cur, dst_cur, src_conn, dst_conn)
 
@@ -1036,6 +2476,43 @@ def check_process(skip_dbs: bool = False, only_check: bool = False, processed_db
     show_results(skip_dbs=skip_dbs, processed_dbs=processed_dbs)
 
 
+# Number of threads counting rows in show_results
+count_workers = 8
+
+
+def count_database_rows(get_conn: Callable[[], ContextManager], db_name: str, primary_keys: Dict[Tuple[str, str], str],
+                        table_statistics: List[Tuple[str, str, str, Optional[int]]] = None) -> Dict[str, int]:
+    """
+    Counts the rows of every table of a database using its own connection, so databases can be counted in parallel.
+
+    :param get_conn: The side to count (get_src_conn or get_dst_conn).
+    :param db_name: The name of the database.
+    :param primary_keys: The primary keys returned by get_table_pks.
+    :param table_statistics: The tables of the database returned by get_table_statistics. Loaded if not provided.
+    :return: A dictionary with the row count of every table, with 'database.table' keys.
+    """
+    # Nothing to count
+    if table_statistics is not None and not table_statistics:
+        return {}
+
+    with get_conn() as (conn, cursor):
+        return get_row_counts_bulk([db_name], cursor, exact=True, primary_keys=primary_keys, table_statistics=table_statistics)
+
+
+def group_by_database(rows: List[Tuple]) -> Dict[str, List[Tuple]]:
+    """
+    Groups rows whose first column is the database name (like the ones of get_table_statistics) by database.
+
+    :param rows: The rows to group.
+    :return: A dictionary with the rows of every database.
+    """
+    rows_by_database: Dict[str, List[Tuple]] = {}
+    for row in rows:
+        rows_by_database.setdefault(row[0], []).append(row)
+
+    return rows_by_database
+
+
 def show_results(skip_dbs: bool = False, processed_dbs: List[str] = None) -> None:
     """
     Compares row counts between source and destination databases to verify migration success.
@@ -1063,36 +2540,46 @@ def show_results(skip_dbs: bool = False, processed_dbs: List[str] = None) -> Non
             # Initialize a progress bar
             progress = create_pbar(len(src_dbs) + len(dst_dbs), leave=False, colour=PbarColors.INFO, units="database")
 
-            # Check row counts in source databases
-            for db in src_dbs:
-                update_pbar(progress=progress, number=1, message=f"Checking [Source].`{db}`", prompt=PbarPrompts.PERCENT_PROMPT)
-                dst_cur.execute(f"USE `{db}`")
-                try:
-                    # Get tables and row counts from the source database
-                    tbls = get_all_tables([db], src_cur)
-                    for table in tbls:
-                        src_cur.execute(f"SELECT COUNT({get_table_pk(db, table, src_cur)}) FROM `{table}`")
-                        src_sizes[f"{db}.{table}"] = src_cur.fetchone()[0]
-                except (mysql.connector.Error, Exception) as ex:
-                    log_message(f"Error checking rows in source database `{db}`: {ex}", LogType.ERROR)
-                    close_pbar(progress)
-                    raise ex
+            # Primary keys and tables of every database, loaded at once per side
+            src_primary_keys = get_table_pks(src_dbs, src_cur)
+            dst_primary_keys = get_table_pks(dst_dbs, dst_cur)
+            src_tables = group_by_database(get_table_statistics(src_dbs, src_cur))
+            dst_tables = group_by_database(get_table_statistics(dst_dbs, dst_cur))
+
+            # Count rows of every database, both sides in parallel. Every worker uses its own connection
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(count_workers, len(src_dbs) + len(dst_dbs)), thread_name_prefix='mysql-migrator-check') as executor:
+                futures = {}
+                for db in src_dbs:
+                    futures[executor.submit(count_database_rows, get_src_conn, db, src_primary_keys, src_tables.get(db, []))] = ('Source', db)
+                for db in dst_dbs:
+                    futures[executor.submit(count_database_rows, get_dst_conn, db, dst_primary_keys, dst_tables.get(db, []))] = ('Destination', db)
+
+                # Collect row counts as they finish. The bar is only updated every progress_update_interval
+                pending_dbs = 0
+                last_progress_update = 0.0
+                for future in concurrent.futures.as_completed(futures):
+                    side, db = futures[future]
+                    pending_dbs += 1
+                    now = tm.monotonic()
+                    if now - last_progress_update >= progress_update_interval:
+                        update_pbar(progress=progress, number=pending_dbs, message=f"Checking [{side}].`{db}`", prompt=PbarPrompts.PERCENT_PROMPT)
+                        pending_dbs = 0
+                        last_progress_update = now
+
+                    try:
+                        db_sizes = future.result()
+                    except (mysql.connector.Error, Exception) as ex:
+                        log_message(f"Error checking rows in {side.lower()} database `{db}`: {ex}", LogType.ERROR)
+                        close_pbar(progress)
+                        for pending in futures:
+                            pending.cancel()
+                        raise ex
 
-            # Check row counts in destination databases
-            for db in dst_dbs:
-                update_pbar(progress=progress, number=1, message=f"Checking [Destination].`{db}`", prompt=PbarPrompts.PERCENT_PROMPT)
-                dst_cur.execute(f"USE `{db}`")
-                try:
-                    # Get tables and row counts from the destination database
-                    tbls = get_all_tables([db], dst_cur)
-                    for table in tbls:
-                        dst_cur.execute(f"SELECT COUNT({get_table_pk(db, table, dst_cur)}) FROM `{table}`")
-                        dst_sizes[f"{db}.{table}"] = dst_cur.fetchone()[0]
-                        row_count += dst_sizes[f"{db}.{table}"]
-                except (mysql.connector.Error, Exception) as ex:
-                    log_message(f"Error checking rows in destination database `{db}`: {ex}", LogType.ERROR)
-                    close_pbar(progress)
-                    raise ex
+                    if side == 'Source':
+                        src_sizes.update(db_sizes)
+                    else:
+                        dst_sizes.update(db_sizes)
+                        row_count += sum(db_sizes.values())
 
             # Close the progress bar
             close_pbar(progress)
@@ -1105,7 +2592,11 @@ def show_results(skip_dbs: bool = False, processed_dbs: List[str] = None) -> Non
             log_message("No data was migrated.", LogType.WARNING)
             return
 
-        if src_sizes == dst_sizes and len(src_sizes) > 0 and len(dst_sizes) > 0:
+        # Single pass over the source counts. Tables missing in the destination also mismatch (None)
+        mismatched_tables = find_mismatched_tables(src_sizes, dst_sizes)
+
+        # No mismatch and the same number of tables means both sides hold the same tables
+        if not mismatched_tables and len(src_sizes) == len(dst_sizes) and len(src_sizes) > 0:
             # Success case
             if not failed_dbs:
                 log_message(f"Check OK! Migration of {row_count:,} rows was successfully completed.", LogType.ADD)
@@ -1118,14 +2609,32 @@ def show_results(skip_dbs: bool = False, processed_dbs: List[str] = None) -> Non
                 log_message(f"Failed databases: {', '.join(failed_dbs)}.", LogType.ERROR)
 
             # Identify databases only in the source or destination
-            check_mismatches(src_dbs, dst_dbs, src_sizes, dst_sizes)
+            check_mismatches(src_dbs, dst_dbs, src_sizes, dst_sizes, mismatched_tables)
 
     except (mysql.connector.Error, Exception) as ex:
         log_message(f"Error during migration check: {ex}", LogType.ERROR)
         return
 
 
-def check_mismatches(src_dbs: List[str], dst_dbs: List[str], src_sizes: Dict[str, int], dst_sizes: Dict[str, int]) -> None:
+def find_mismatched_tables(src_sizes: Dict[str, int], dst_sizes: Dict[str, int]) -> List[Tuple[str, int, Optional[int]]]:
+    """
+    Finds the source tables whose row count is different (or missing) in the destination, in a single pass.
+
+    :param src_sizes: Row counts in source databases.
+    :param dst_sizes: Row counts in destination databases.
+    :return: A list of (table, source rows, destination rows or None) tuples.
+    """
+    mismatched_tables = []
+    for table, size in src_sizes.items():
+        dst_size = dst_sizes.get(table)
+        if dst_size != size:
+            mismatched_tables.append((table, size, dst_size))
+
+    return mismatched_tables
+
+
+def check_mismatches(src_dbs: List[str], dst_dbs: List[str], src_sizes: Dict[str, int], dst_sizes: Dict[str, int],
+                     mismatched_tables: List[Tuple[str, int, Optional[int]]] = None) -> None:
     """
     Logs databases or tables that have different row counts or are only present in the source or destination.
 
@@ -1133,26 +2642,33 @@ def check_mismatches(src_dbs: List[str], dst_dbs: List[str], src_sizes: Dict[str
     :param dst_dbs: List of destination databases.
     :param src_sizes: Row counts in source databases.
     :param dst_sizes: Row counts in destination databases.
+    :param mismatched_tables: The result of find_mismatched_tables, if already known.
     :return: None
     """
+    # Databases only in one side, keeping the order of the lists
+    src_set = set(src_dbs)
+    dst_set = set(dst_dbs)
+    only_src = [db for db in src_dbs if db not in dst_set]
+    only_dst = [db for db in dst_dbs if db not in src_set]
+
     # Detect databases only in the source
-    if any(db not in dst_dbs for db in src_dbs):
+    if only_src:
         log_message("Databases only in source server:", LogType.ERROR)
-        for db in src_dbs:
-            if db not in dst_dbs:
-                log_message(f" - {db}", LogType.ERROR)
+        for db in only_src:
+            log_message(f" - {db}", LogType.ERROR)
 
     # Detect databases only in the destination
-    if any(db not in src_dbs for db in dst_dbs):
+    if only_dst:
         log_message("Databases only in destination server:", LogType.ERROR)
-        for db in dst_dbs:
-            if db not in src_dbs:
-                log_message(f" - {db}", LogType.ERROR)
+        for db in only_dst:
+            log_message(f" - {db}", LogType.ERROR)
 
     # Detect tables with a different number of rows between source and destination
-    for table, size in src_sizes.items():
-        if table in dst_sizes and dst_sizes[table] != src_sizes[table]:
-            log_message(f"Tables with a different number of rows: {table} => {src_sizes[table]} | {dst_sizes[table]}", LogType.ERROR)
+    if mismatched_tables is None:
+        mismatched_tables = find_mismatched_tables(src_sizes, dst_sizes)
+    for table, size, dst_size in mismatched_tables:
+        if dst_size is not None:
+            log_message(f"Tables with a different number of rows: {table} => {size} | {dst_size}", LogType.ERROR)
 
 
 def remove_database(db_name: str) -> Tuple[bool, Exception]:
@@ -1167,7 +2683,7 @@ def remove_database(db_name: str) -> Tuple[bool, Exception]:
 
     try:
         # Remove the database from the destination server
-        dst_cur.execute(f"DROP DATABASE `{db_name}`")
+        dst_cur.execute(f"DROP DATABASE {escape_column_name(db_name)}")
     except mysql.connector.Error as ex:
         # Only raise the error if it is not the database already exists error (1008)
         if ex.errno != errorcode.ER_DB_DROP_EXISTS:
@@ -1184,38 +2700,35 @@ def remove_database(db_name: str) -> Tuple[bool, Exception]:
 
 def remove_databases(dbs: List[str]) -> Tuple[bool, Exception]:
     """
-    Removes a list of databases from the destination MySQL server.
+    Removes a list of databases from the destination MySQL server, pipelining the DROP DATABASE
+    statements in a single multi-statement query.
 
     :param dbs: A list of database names to remove.
     :return: A tuple indicating the success of the operation and an exception if any occurred.
     """
+    progress = None
+
     try:
         # Create a progress bar for removing databases
         progress = create_pbar(total=len(dbs), leave=False, colour=PbarColors.DROP, units='database')
 
-        all_process_ok = True
-        with concurrent.futures.ThreadPoolExecutor(max_workers=(os.cpu_count() - 1), thread_name_prefix='mysql-migrator-drop') as executor:
-            futures = []
-
-            # Submit each database migration as a separate thread
-            for db_name in dbs:
-                futures.append(executor.submit(lambda db=db_name: (remove_database(db))))
-
-            # Wait for all threads to complete
-            for future in concurrent.futures.as_completed(futures):
-                try:
-                    success, exception = future.result()
-
-                    if not success:
-                        raise exception
-                except Exception as ex:
-                    return False, ex
-
-                update_pbar(progress=progress, number=1, message="Destination databases are being removed...", prompt=PbarPrompts.INFO_PROMPT)
-                sleep(0.1)
-
-        if not all_process_ok:
-            return False, Exception('Not all databases could be dropped')
+        # Connect to the destination database
+        with get_dst_conn() as (dst_conn, dst_cur):
+            # Send all drops at once. Result sets come back as every database is dropped
+            update_pbar(progress=progress, number=0, message="Destination databases are being removed...", prompt=PbarPrompts.INFO_PROMPT)
+            dst_cur.execute(' '.join(f"DROP DATABASE IF EXISTS {escape_column_name(db_name)};" for db_name in dbs))
+
+            # The description doesn't change, only update the counter every progress_update_interval
+            dropped_dbs = 0
+            last_progress_update = 0.0
+            for _ in dst_cur.fetchsets():
+                dropped_dbs += 1
+                now = tm.monotonic()
+                if now - last_progress_update >= progress_update_interval:
+                    progress.update(dropped_dbs)
+                    dropped_dbs = 0
+                    last_progress_update = now
+            progress.update(dropped_dbs)
     except Exception as ex:
         return False, ex
     finally:
@@ -1259,13 +2772,14 @@ def handle_grants_migration_warning(src_conn: CMySQLConnection, dst_conn: CMySQL
         )
 
         # Progress bar to give the user time to cancel the process
-        progress = tqdm(total=10, leave=False, colour="#30a5ab", unit='table')
+        progress = create_pbar(10, leave=False, colour=PbarColors.WAIT, units='second')
         for second in range(10):
-            progress.update(1)
+            # The description is drawn by update()
             progress.set_description(
                 f"[{Fore.YELLOW}#{Style.RESET_ALL}]   - {Fore.YELLOW}Waiting 10 seconds in case you want to "
-                f"cancel (ctrl+c) the process{Style.RESET_ALL}."
+                f"cancel (ctrl+c) the process{Style.RESET_ALL}.", refresh=False
             )
+            progress.update(1)
             sleep(1)
 
         close_pbar(progress)
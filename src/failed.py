@@ -1,6 +1,53 @@
 import os
+import threading
 from typing import Optional, List
 
+# Failed databases log file
+failed_log_path = './failed_databases.log'
+
+# In-memory copy of the log file, loaded once. None when the log file doesn't exist
+failed_databases: Optional[List[str]] = None
+failed_databases_set = set()
+failed_databases_loaded = False
+
+# Database workers may fail at the same time
+failed_lock = threading.Lock()
+
+
+def load_failed_databases() -> None:
+    """
+    Loads the 'failed_databases.log' file into memory, only the first time. Must be called holding failed_lock.
+
+    :return: None
+    """
+    global failed_databases, failed_databases_set, failed_databases_loaded
+
+    if failed_databases_loaded:
+        return
+
+    if os.path.exists(failed_log_path):
+        with open(failed_log_path, 'r') as file:
+            # Worker processes (--process-pool) may log the same database twice
+            failed_databases = list(dict.fromkeys(line.strip() for line in file))
+    else:
+        failed_databases = None
+
+    failed_databases_set = set(failed_databases or [])
+    failed_databases_loaded = True
+
+
+def reload_failed_databases() -> None:
+    """
+    Forgets the in-memory copy of the 'failed_databases.log' file, so it is read again on next use.
+    Needed when other processes may have written to it (--process-pool).
+
+    :return: None
+    """
+    global failed_databases_loaded
+
+    with failed_lock:
+        failed_databases_loaded = False
+
 
 def add_failed_database(db_name: str) -> None:
     """
@@ -9,17 +56,20 @@ def add_failed_database(db_name: str) -> None:
     :param db_name: The name of the database that failed.
     :return: None
     """
-    failed_databases = []
+    global failed_databases
+
+    with failed_lock:
+        load_failed_databases()
 
-    # Check if the log file exists and read the current failed databases
-    if os.path.exists('./failed_databases.log'):
-        with open('failed_databases.log', 'r') as file:
-            failed_databases = [line.strip() for line in file]
+        # Add the database to the log file if it is not already listed
+        if db_name not in failed_databases_set:
+            with open(failed_log_path, 'a') as file:
+                file.write(f"{db_name}\n")
 
-    # Add the database to the log file if it is not already listed
-    if db_name not in failed_databases:
-        with open('failed_databases.log', 'a') as file:
-            file.write(f"{db_name}\n")
+            if failed_databases is None:
+                failed_databases = []
+            failed_databases.append(db_name)
+            failed_databases_set.add(db_name)
 
 
 def remove_failed_databases() -> None:
@@ -28,8 +78,15 @@ def remove_failed_databases() -> None:
 
     :return: None
     """
-    if os.path.exists('./failed_databases.log'):
-        os.remove('./failed_databases.log')
+    global failed_databases, failed_databases_set, failed_databases_loaded
+
+    with failed_lock:
+        if os.path.exists(failed_log_path):
+            os.remove(failed_log_path)
+
+        failed_databases = None
+        failed_databases_set = set()
+        failed_databases_loaded = True
 
 
 def exists_failed_databases() -> bool:
@@ -38,7 +95,9 @@ def exists_failed_databases() -> bool:
 
     :return: True if the log file exists, False otherwise.
     """
-    return os.path.exists('./failed_databases.log')
+    with failed_lock:
+        load_failed_databases()
+        return failed_databases is not None
 
 
 def get_failed_dbs() -> Optional[List[str]]:
@@ -47,8 +106,6 @@ def get_failed_dbs() -> Optional[List[str]]:
 
     :return: A list of failed database names, or None if the file doesn't exist.
     """
-    if not os.path.exists('./failed_databases.log'):
-        return None
-
-    with open('failed_databases.log', 'r') as file:
-        return [line.strip() for line in file]
+    with failed_lock:
+        load_failed_databases()
+        return list(failed_databases) if failed_databases is not None else None
@@ -1,3 +1,7 @@
+import atexit
+import queue
+import sys
+import threading
 from enum import Enum
 from colorama import Fore, Style
 
@@ -25,6 +29,61 @@ class LogType(Enum):
     COMMENT = (Fore.BLUE, "i")
     CODE = (Fore.CYAN, "@")
 
+    def __init__(self, color: str, symbol: str):
+        # Prefixes are built once per log type instead of on every log call
+        self.color = color
+        self.prefix = f"{Style.RESET_ALL}[{color}{symbol}{Style.RESET_ALL}] {color}{Style.RESET_ALL}"
+        self.cont_prefix = f"{Style.RESET_ALL}{color}  {Style.RESET_ALL}"
+
+
+# Messages are written to stdout by a single background thread, so logging never blocks the workers
+log_queue = queue.Queue()
+
+# Max number of messages joined into a single stdout write
+log_batch_size = 256
+
+
+def log_writer() -> None:
+    """
+    Background thread loop. Waits for messages and writes every pending one with a single write and flush.
+
+    :return: None
+    """
+    while True:
+        batch = [log_queue.get()]
+
+        # Take whatever else is already queued, without waiting for more
+        while len(batch) < log_batch_size:
+            try:
+                batch.append(log_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        try:
+            sys.stdout.write("".join(batch))
+            sys.stdout.flush()
+        except (OSError, ValueError):
+            pass
+        finally:
+            for _ in batch:
+                log_queue.task_done()
+
+
+def flush_logs() -> None:
+    """
+    Blocks until every queued log message has been written to stdout.
+
+    :return: None
+    """
+    log_queue.join()
+
+
+log_thread = threading.Thread(target=log_writer, name="log-writer", daemon=True)
+log_thread.start()
+
+# Don't lose queued messages on exit
+atexit.register(flush_logs)
+
 
 def get_log_message(message: str, log_type: LogType = LogType.INFO, will_continue: bool = False, is_continuation: bool = False) -> str:
     """
@@ -36,12 +95,8 @@ def get_log_message(message: str, log_type: LogType = LogType.INFO, will_continu
     :param is_continuation: If True, no prefix will be added.
     :return: The formatted log message string.
     """
-    color, symbol = log_type.value
-    prefix = f"[{color}{symbol}{Style.RESET_ALL}] " if not is_continuation else ""
-    indent = "  " if is_continuation else ""
-
     # Return the formatted log message
-    return f"{Style.RESET_ALL}{prefix}{color}{indent}{Style.RESET_ALL}{message}"
+    return (log_type.cont_prefix if is_continuation else log_type.prefix) + message
 
 
 def log_message(message: str, log_type: LogType = LogType.INFO, will_continue: bool = False, is_continuation: bool = False) -> None:
@@ -54,10 +109,10 @@ def log_message(message: str, log_type: LogType = LogType.INFO, will_continue: b
     :param is_continuation: If True, the log is a continuation, and no prefix is added.
     :return: None
     """
-    end = '' if will_continue else '\n'
+    formatted = get_log_message(message=message, log_type=log_type, is_continuation=is_continuation)
 
     # Print the formatted log message
-    print(f"{get_log_message(message=message, log_type=log_type, will_continue=will_continue, is_continuation=is_continuation)}", end=end)
+    log_queue.put_nowait(formatted if will_continue else formatted + '\n')
 
 
 def log_raw_message(message: str, log_type: LogType = LogType.INFO) -> None:
@@ -68,7 +123,5 @@ def log_raw_message(message: str, log_type: LogType = LogType.INFO) -> None:
     :param log_type: The type of log (INFO, ERROR, etc.). Defaults to INFO.
     :return: None
     """
-    color, _ = log_type.value
-
     # Print the raw message without additional formatting
-    print(f"{Style.RESET_ALL}{color}{message}{Style.RESET_ALL}")
+    log_queue.put_nowait(f"{Style.RESET_ALL}{log_type.color}{message}{Style.RESET_ALL}\n")
@@ -1,17 +1,18 @@
 import argparse
 import concurrent.futures
+import multiprocessing
 import os
 import time as tm
 import signal
-import math
 from tqdm.std import tqdm
 from time import sleep
-from logs import log_message, Fore, Style, LogType
+from logs import log_message, flush_logs, Fore, Style, LogType
 from typing import List, Dict
-from progress import create_pbar, update_pbar, close_pbar, update_pos_pbar, PbarColors, PbarPrompts, get_color_for_progress
-from db import close_handlers, get_process_dbs, connect, get_all_tables, count_migration_rows, migrate_grants, check_process, remove_databases, handle_grants_migration_warning, migrate_database
-from failed import get_failed_dbs, remove_failed_databases
-from config import source_config, destination_config
+from progress import create_pbar, update_pbar, close_pbar, PbarColors, PbarPrompts, get_color_for_progress
+from db import close_handlers, get_process_dbs, connect, get_all_tables, count_migration_rows, migrate_grants, check_process, remove_databases, handle_grants_migration_warning, migrate_database, relax_destination_durability, restore_destination_durability, get_connection_pool_size, set_connection_pool_size, set_thread_pinning, pin_database_worker, init_database_process, migrate_database_process
+from failed import get_failed_dbs, remove_failed_databases, reload_failed_databases
+import config
+from config import source_config, destination_config, c_extension_available
 from datetime import datetime
 
 
@@ -28,14 +29,16 @@ def wait_progress(seconds: int = 10, message: str = None, add_msg: bool = False)
         message = f"{Fore.YELLOW}Waiting {seconds} seconds in case you want to " \
                   f"cancel (ctrl+c) the process{Style.RESET_ALL}."
 
-    # Create progress bar for waiting period
-    progress = create_pbar(total=seconds, leave=False, colour=PbarColors.WAIT, units='second')
+    # Create progress bar for waiting period, redrawn at most twice per second
+    progress = create_pbar(total=seconds, leave=False, colour=PbarColors.WAIT, units='second', mininterval=0.5)
 
-    # Wait for the specified number of seconds
-    for second in range(seconds):
-        # Update progress bar and display the waiting message
-        update_pbar(progress=progress, number=1, message=message, prompt=PbarPrompts.WAIT_PROMPT)
-        sleep(1)
+    # The message doesn't change, set it once
+    update_pbar(progress=progress, number=0, message=message, prompt=PbarPrompts.WAIT_PROMPT)
+
+    # Wait for the specified number of seconds, in half second steps so Ctrl+C stays responsive
+    for step in range(seconds * 2):
+        sleep(0.5)
+        progress.update(0.5)
 
     # Close the progress bar
     close_pbar(progress, add_msg)
@@ -50,6 +53,18 @@ def migration_process(args: Dict = None) -> List[str]:
     """
     count_records_before_start = False
 
+    # Size pools before the first connection. With --process-pool, workers have their own pools and this
+    # process only needs a pair at once (pools open all their connections when they are created)
+    if args.process_pool:
+        set_connection_pool_size(2)
+    else:
+        set_connection_pool_size(get_connection_pool_size(args.db_thcount, args.table_thcount, args.shards))
+
+    # --bulk-transfer turns on the LOAD DATA path of the config. Destination connections are opened
+    # with local infile support only if it's needed
+    if args.bulk_transfer:
+        config.load_data_local_infile = True
+
     # Connect to the source and destination databases
     try:
         src_cur, dst_cur, src_conn, dst_conn = connect(set_session_vars=False)
@@ -68,20 +83,19 @@ def migration_process(args: Dict = None) -> List[str]:
 
     # If there are failed databases, only process those
     if failed_dbs:
-        src_dbs = [db for db in src_dbs if db in failed_dbs]
-        dst_dbs = [db for db in dst_dbs if db in failed_dbs]
+        failed_set = set(failed_dbs)
+        src_dbs = [db for db in src_dbs if db in failed_set]
+        dst_dbs = [db for db in dst_dbs if db in failed_set]
 
     # If the user opts to skip existing databases on the destination
     if args.skip_dbs:
-        src_dbs = [db for db in src_dbs if db not in dst_dbs]
+        dst_set = set(dst_dbs)
+        src_dbs = [db for db in src_dbs if db not in dst_set]
         skip_dbs = len(dst_dbs) - len(src_dbs)
         dst_dbs = src_dbs
 
-    # Get all tables from the source databases
-    tables = get_all_tables(src_dbs, src_cur)
-
-    # Close all database handlers
-    close_handlers(src_cur, dst_cur, src_conn, dst_conn)
+    # Get all tables from the source databases (cached, schema migration reuses them)
+    tables = get_all_tables(src_dbs, src_cur, cached=True)
 
     # Logging information
     databases_to_migrate = max(0, len(src_dbs) - skip_dbs)
@@ -95,13 +109,36 @@ def migration_process(args: Dict = None) -> List[str]:
         log_message(f"  - {rows_to_migrate:,} rows to migrate", LogType.COMMENT)
 
     # Thread and batch size information
-    log_message(f"  - {args.db_thcount} thread workers for databases and {args.table_thcount} for tables. {(args.db_thcount * args.table_thcount)} can run simultaneously. This machine has {os.cpu_count()} cores.", LogType.COMMENT)
-    log_message(f"  - Inserts will be applied in groups of {args.batch_size:,}", LogType.COMMENT)
+    cores = get_available_cores()
+    log_message(f"  - {args.db_thcount} thread workers for databases and {args.table_thcount} for tables. {(args.db_thcount * args.table_thcount)} can run simultaneously. This machine has {cores} usable cores.", LogType.COMMENT)
+    if args.db_thcount * args.table_thcount > 2 * cores:
+        log_message(f"  - {Fore.YELLOW}More than twice as many workers as cores, context switches may slow down the migration{Style.RESET_ALL}", LogType.WARNING)
+    if config.load_data_local_infile:
+        log_message(f"  - Rows will be loaded with LOAD DATA LOCAL INFILE in groups of {args.batch_size:,}", LogType.COMMENT)
+    else:
+        log_message(f"  - Inserts will be applied in groups of {args.batch_size:,}", LogType.COMMENT)
+    if args.shards > 1:
+        log_message(f"  - Big tables will be split in up to {args.shards} key ranges copied in parallel", LogType.COMMENT)
 
     # Database skipping and dropping options
     log_message(f"  - Existing databases will be skipped: {args.skip_dbs}", LogType.COMMENT)
     log_message(f"  - Existing databases will be dropped: {not args.skip_dbs and not args.keep_dbs}", LogType.COMMENT)
 
+    # Worker processes instead of threads
+    if args.process_pool:
+        log_message(f"  - Databases will be migrated by {args.db_thcount} worker processes", LogType.COMMENT)
+
+    # Pin worker threads to cores
+    if args.pin_threads:
+        if set_thread_pinning(args.db_thcount):
+            log_message("  - Database and table worker threads will be pinned to CPU cores", LogType.COMMENT)
+        else:
+            log_message(f"  - {Fore.YELLOW}CPU pinning is not supported on this platform, threads won't be pinned{Style.RESET_ALL}", LogType.WARNING)
+
+    # Relaxed durability on the destination
+    if args.fast_unsafe:
+        log_message(f"  - {Fore.YELLOW}Destination durability will be relaxed during the migration (--fast-unsafe){Style.RESET_ALL}", LogType.WARNING)
+
     # Handle grants migration if selected
     if args.grants:
         log_message("  - All grants will be migrated!", LogType.COMMENT)
@@ -116,6 +153,14 @@ def migration_process(args: Dict = None) -> List[str]:
         f"  - @MySQL Version: {src_conn.get_server_info()} -> {dst_conn.get_server_info()}", LogType.COMMENT
     )
 
+    # Close all database handlers. Pooled connections can't be used once they are handed back
+    close_handlers(src_cur, dst_cur, src_conn, dst_conn)
+
+    # Warn when running on the slow pure Python protocol implementation
+    if not c_extension_available:
+        log_message(f"  - {Fore.YELLOW}MySQL C extension not found, falling back to the pure Python connector. "
+                    f"Migration will be slower!{Style.RESET_ALL}", LogType.WARNING)
+
     log_message("Inspection done!", LogType.INFO)
     sleep(1)
 
@@ -140,16 +185,28 @@ def migration_process(args: Dict = None) -> List[str]:
         wait_progress(seconds=3)
 
         # Create progress bar for the overall process
-        progress = create_pbar(len(src_dbs) + 2, leave=True, colour=PbarColors.DATABASE, units='database')
-        update_pos_pbar(progress, 0)
+        progress = create_pbar(len(src_dbs) + 2, leave=True, colour=PbarColors.DATABASE, units='database',
+                               mininterval=0.1, miniters=max(1, len(src_dbs) // 100), position=0)
         update_pbar(progress=progress, number=1, message="Overall process", prompt=PbarPrompts.PERCENT_PROMPT)
 
+        # Relax destination durability if requested. Original values are restored even if the process fails
+        original_durability = None
+        if args.fast_unsafe:
+            try:
+                original_durability = relax_destination_durability()
+            except Exception as ex:
+                log_message(f"Could not relax destination durability, running with the current settings. Error was: {ex}", LogType.WARNING)
+
         # Execute the migration process using multithreading
-        all_process_ok = run_migration_threads(src_dbs, args, progress)
+        try:
+            all_process_ok = run_migration_threads(src_dbs, args, progress)
+        finally:
+            if original_durability:
+                restore_destination_durability(original_durability)
 
         # Update progress status
-        progress.colour = 'green' if all_process_ok else 'red'
-        update_pbar(progress=progress, number=1, message="Overall process finished!", prompt=(PbarPrompts.ADD_PROMPT if all_process_ok else PbarPrompts.ERROR_PROMPT))
+        update_pbar(progress=progress, colour='green' if all_process_ok else 'red', number=1, message="Overall process finished!",
+                    prompt=(PbarPrompts.ADD_PROMPT if all_process_ok else PbarPrompts.ERROR_PROMPT))
 
         # Migrate grants?
         if args.grants:
@@ -171,22 +228,53 @@ def run_migration_threads(src_dbs: List[str], args: Dict, progress: tqdm) -> boo
     :return: True if all processes succeeded, False otherwise.
     """
     all_process_ok = True
-    with concurrent.futures.ThreadPoolExecutor(max_workers=args.db_thcount, thread_name_prefix='mysql-migrator') as executor:
-        futures = []
 
-        # Submit each database migration as a separate thread
-        for db_name in src_dbs:
-            futures.append(executor.submit(lambda db=db_name: (db, migrate_database(db, args))))
+    # Databases are migrated by threads or, with --process-pool, by spawned processes (a fork would share the parent's sockets)
+    if args.process_pool:
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=args.db_thcount, mp_context=multiprocessing.get_context('spawn'),
+                                                          initializer=init_database_process,
+                                                          initargs=(get_connection_pool_size(1, args.table_thcount, args.shards), args.db_thcount if args.pin_threads else None,
+                                                                    config.load_data_local_infile))
+        worker = migrate_database_process
+    else:
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=args.db_thcount, thread_name_prefix='mysql-migrator',
+                                                         initializer=pin_database_worker)
+        worker = migrate_database
 
-        # Wait for all threads to complete
-        for future in concurrent.futures.as_completed(futures):
-            try:
-                future.result()
-            except Exception:
-                all_process_ok = False
+    with executor:
+        running = set()
 
-            update_pbar(progress=progress, colour=get_color_for_progress(progress.n / progress.total), number=1, message="Overall process", prompt=PbarPrompts.PERCENT_PROMPT)
-            sleep(0.05)
+        # Submit each database migration as a separate thread (or process)
+        for db_name in src_dbs:
+            running.add(executor.submit(worker, db_name, args))
+
+        # Finished databases are added to the progress bar in groups
+        pending = 0
+        last_flush = tm.monotonic()
+        flush_size = max(1, len(src_dbs) // 200)
+
+        # Wait for all threads to complete, handling every database finished since the last wakeup at once
+        while running:
+            done, running = concurrent.futures.wait(running, timeout=0.1, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                try:
+                    future.result()
+                except Exception:
+                    all_process_ok = False
+
+            pending += len(done)
+            if pending and (pending >= flush_size or tm.monotonic() - last_flush > 0.1):
+                update_pbar(progress=progress, colour=get_color_for_progress((progress.n + pending) / progress.total), number=pending, message="Overall process", prompt=PbarPrompts.PERCENT_PROMPT)
+                pending = 0
+                last_flush = tm.monotonic()
+
+        # Add the remaining ones
+        if pending:
+            update_pbar(progress=progress, colour=get_color_for_progress((progress.n + pending) / progress.total), number=pending, message="Overall process", prompt=PbarPrompts.PERCENT_PROMPT)
+
+    # Worker processes wrote their failed databases to the log file
+    if args.process_pool:
+        reload_failed_databases()
 
     return all_process_ok
 
@@ -198,12 +286,13 @@ def seconds_to_time(seconds: float = 0.0) -> str:
     :param seconds: Time in seconds.
     :return: Formatted string in the format "hh:mm:ss".
     """
-    # Calculate hours, minutes, and seconds
-    hours, rest = divmod(seconds, 3600)
+    # Calculate hours and minutes on the whole seconds, keep the fraction for the seconds
+    total = int(seconds)
+    hours, rest = divmod(total, 3600)
     minutes, rest_secs = divmod(rest, 60)
 
     # Return formatted time
-    return f"{int(hours):02}h:{int(minutes):02}min:{rest_secs:04.1f}s"
+    return f"{hours:02d}h:{minutes:02d}min:{rest_secs + seconds - total:04.1f}s"
 
 
 def signal_handler(sig, frame) -> None:
@@ -215,11 +304,23 @@ def signal_handler(sig, frame) -> None:
     :return: None
     """
     sleep(1)
+    flush_logs()
     print(f"{Style.RESET_ALL}", flush=True)
     log_message(f"{Fore.RED}The process was cancelled by the user{Style.RESET_ALL}!", LogType.ERROR)
     exit(0)
 
 
+def get_available_cores() -> int:
+    """
+    Returns the number of cores this process can run on (CPU affinity), or the number of cores of the machine.
+
+    :return: Number of usable cores.
+    """
+    if hasattr(os, 'sched_getaffinity'):
+        return max(1, len(os.sched_getaffinity(0)))
+    return os.cpu_count() or 1
+
+
 def parse_args() -> argparse.Namespace:
     """
     Parses command-line arguments for the migration script.
@@ -228,9 +329,11 @@ def parse_args() -> argparse.Namespace:
     """
     parser = argparse.ArgumentParser(description='mysql.migrator tool. Use it to migrate between MySQL database instances.')
 
-    # Get default value for db_thcount and table_thcount params
-    db_thcount = int(math.sqrt(os.cpu_count()))
-    table_thcount = int(math.sqrt(os.cpu_count()))
+    # Get default value for db_thcount and table_thcount params. Workers mostly wait for MySQL, but
+    # the two nested pools multiply, so keep them around (at most twice) the usable cores
+    cores = get_available_cores()
+    db_thcount = min(8, cores)
+    table_thcount = max(2, cores // db_thcount)
 
     # Add arguments
     parser.add_argument('-b', '--batch-size', type=int, default=2048, dest='batch_size',
@@ -251,6 +354,24 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument('-x', '--thread-table', type=int, default=table_thcount, dest='table_thcount',
                         help=f'Optional. Number of threads to use (for every database) for table migration. Default value will be {table_thcount}.')
 
+    parser.add_argument('-k', '--shards', type=int, default=1, dest='shards',
+                        help='Optional. Split big tables in up to this number of key ranges, copied in parallel with their own connections. Default is 1 (no split).')
+
+    parser.add_argument('--fast-unsafe', action='store_true', dest='fast_unsafe',
+                        help='Optional. Set innodb_flush_log_at_trx_commit=2 and sync_binlog=0 on the destination during the migration (restored at the end). '
+                             'Faster, but a destination crash may lose migrated data. Needs SYSTEM_VARIABLES_ADMIN or SUPER.')
+
+    parser.add_argument('--process-pool', action='store_true', dest='process_pool',
+                        help='Optional. Migrate every database in its own worker process instead of a thread, so row conversion runs on several CPUs. '
+                             'By default, threads are used.')
+
+    parser.add_argument('--pin-threads', action='store_true', dest='pin_threads',
+                        help='Optional. Pin database and table worker threads to CPU cores (Linux only). By default, the OS schedules them freely.')
+
+    parser.add_argument('--bulk-transfer', action='store_true', dest='bulk_transfer',
+                        help='Optional. Load rows with LOAD DATA LOCAL INFILE, streamed through a named pipe, instead of INSERT statements. '
+                             'Much faster for big tables, but the destination server must run with local_infile=ON.')
+
     parser.add_argument('-c', '--check-only', action='store_true', dest='check',
                         help='Optional. Only check the last migration process. No changes will be made.')
 
@@ -1,8 +1,10 @@
+import sys
 from tqdm import tqdm, std
 from enum import Enum
 from colorama import Fore, Style, Back
-from logs import LogType, get_log_message
+from logs import LogType, get_log_message, flush_logs
 from typing import Tuple
+from functools import lru_cache
 
 
 class PbarPrompts(Enum):
@@ -23,10 +25,46 @@ class PbarColors(Enum):
     THROTTLED = "#cc745e"
     DATA = "#cc995e"
     INFO = "#cc33ba"
+    COUNT = "#cc1c91"
     WAIT = "#30a5ab"
 
 
-def create_pbar(total: int, colour: PbarColors, units: str, leave: bool = False) -> std.tqdm:
+class NullPbar:
+    """
+    Progress bar which does nothing, used when stderr is not a terminal (CI, nohup, redirected output).
+    It's falsy, so the helpers below skip it, but code using it directly still works.
+    """
+
+    def __init__(self, total: int, colour: str = '', position: int = None):
+        self.n = 0
+        self.total = total
+        self.colour = colour
+        self.pos = position
+
+    def __bool__(self) -> bool:
+        return False
+
+    def update(self, n: float = 1) -> None:
+        self.n += n
+
+    def set_description(self, desc: str = None, refresh: bool = True) -> None:
+        pass
+
+    def refresh(self) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def write(self, s: str) -> None:
+        pass
+
+
+def create_pbar(total: int, colour: PbarColors, units: str, leave: bool = False, mininterval: float = None,
+                maxinterval: float = None, miniters: int = None, position: int = None) -> std.tqdm:
     """
     Create a progress bar with the specified total, color, and unit type.
 
@@ -34,25 +72,26 @@ def create_pbar(total: int, colour: PbarColors, units: str, leave: bool = False)
     :param colour: Color of the progress bar from PbarColors enum.
     :param units: Unit of measurement for the progress bar.
     :param leave: Whether or not to leave the progress bar displayed after completion.
-    :return: A tqdm progress bar instance.
+    :param mininterval: Minimum seconds between redraws. tqdm default if None.
+    :param maxinterval: Maximum seconds between redraws. tqdm default if None.
+    :param miniters: Minimum iterations between redraws. tqdm default (dynamic) if None.
+    :param position: Line of the progress bar (0 is the top one). tqdm picks a free one if None.
+    :return: A tqdm progress bar instance, or a NullPbar if stderr is not a terminal.
     """
-    # Create and return the progress bar with specified parameters
-    progress = tqdm(total=total, leave=leave, colour=colour.value, unit=units)
-    return progress
+    # Nobody sees the progress bars when stderr is not a terminal, don't spend time drawing them
+    if not sys.stderr.isatty():
+        return NullPbar(total, colour.value, position)
 
+    # Write queued log messages first, so they show up above the progress bar
+    flush_logs()
 
-def update_pos_pbar(progress: std.tqdm, position: int = 0) -> None:
-    """
-    Update the position of the progress bar.
+    # Only forward the throttling options which were set, tqdm picks the defaults
+    throttling = {name: value for name, value in (('mininterval', mininterval), ('maxinterval', maxinterval), ('miniters', miniters))
+                  if value is not None}
 
-    :param progress: The progress bar to update.
-    :param position: The new position for the progress bar. Defaults to 0.
-    :return: None
-    """
-    # Check progress was created
-    if progress:
-        # Update the position of the progress bar
-        progress.pos = position
+    # Create and return the progress bar with specified parameters
+    progress = tqdm(total=total, leave=leave, colour=colour.value, unit=units, position=position, **throttling)
+    return progress
 
 
 def update_pbar(progress: std.tqdm, number: int, message: str, prompt: PbarPrompts = PbarPrompts.NONE, colour: str = None) -> None:
@@ -68,12 +107,17 @@ def update_pbar(progress: std.tqdm, number: int, message: str, prompt: PbarPromp
     """
     # Check progress was created
     if progress:
-        # Set the progress bar color if provided
-        if colour:
+        # Set the progress bar color if provided and changed (tqdm validates every new colour)
+        if colour and colour != getattr(progress, '_last_colour', None):
             progress.colour = colour
+            progress._last_colour = colour
 
-        # Set the description with prompt and message
-        progress.set_description(f"{prompt.value}{message}")
+        # Set the description with prompt and message, only if it changed. If the bar is going
+        # to be updated below, let update() redraw it instead of redrawing it twice
+        description = prompt.value + message
+        if description != getattr(progress, '_last_desc', None):
+            progress.set_description(description, refresh=number <= 0)
+            progress._last_desc = description
 
         # Update the progress bar by the given number
         if number > 0:
@@ -120,6 +164,11 @@ def interpolate_color(start_color: Tuple[int, int, int], end_color: Tuple[int, i
     return '#{:02x}{:02x}{:02x}'.format(*interpolated_color)
 
 
+# Progress bar gradient, from blueish to greenish. The 256 colors are built once at import.
+# Progress is scaled by 0.75 to adjust the range of the color transition
+progress_gradient = tuple(interpolate_color((42, 99, 209), (13, 188, 121), bucket / 255 * 0.75) for bucket in range(256))
+
+
 def get_color_for_progress(progress: float) -> str:
     """
     Returns a color corresponding to the progress percentage, by interpolating between
@@ -128,13 +177,20 @@ def get_color_for_progress(progress: float) -> str:
     :param progress: A float representing the progress percentage, ranging from 0 (0%) to 1 (100%).
     :return: A hex color string that represents the interpolated color based on progress.
     """
-    # Define the starting and ending RGB colors
-    start_color = (42, 99, 209)  # RGB for starting color (blueish)
-    end_color = (13, 188, 121)   # RGB for ending color (greenish)
+    # Only 256 colors can be told apart, so quantize the progress and look it up
+    return progress_gradient[min(255, max(0, int(progress * 255)))]
+
 
-    # Use interpolation to calculate the color based on progress
-    # Progress is scaled by 0.45 to adjust the range of the color transition
-    return interpolate_color(start_color, end_color, progress * 0.75)
+# Progress prompt fragments of every batch size state, keyed by the sign of (batch size - calculated batch size):
+# the state label, the color of the batch size and the progress bar color
+batch_size_prompts = {
+    # Batch size reduced (throttled), display in yellow/red
+    -1: (f'{Fore.BLACK}{Back.LIGHTRED_EX}throttled{Style.RESET_ALL}', Fore.YELLOW, '#cc745e'),
+    # Normal batch size
+    0: (f'{Fore.WHITE}{Back.BLUE}normal{Style.RESET_ALL}', Fore.GREEN, '#cc995e'),
+    # Batch size increased due to boost, display in green
+    1: (f'{Fore.BLACK}{Back.LIGHTGREEN_EX}boost{Style.RESET_ALL}', Fore.GREEN, '#ccb15e'),
+}
 
 
 def generate_progress_prompts(
@@ -160,51 +216,31 @@ def generate_progress_prompts(
     :param difference_info: A string representing the time difference info for the last batch.
     :return: A tuple containing the color for the progress bar and the message to display in the progress bar.
     """
-    batch_info = ''
-    throttled_info = ''
-    pk_info = ''
-    colour = '#ffffff'  # Default color for the progress bar
-
-    # Adjust progress message and color based on batch size
-    if batch_size < calculated_batch_size:
-        # Throttled Info
-        throttled_info = f'{Fore.BLACK}{Back.LIGHTRED_EX}throttled{Style.RESET_ALL}'
-
-        # Batch size reduced (throttled), display in yellow/red
-        batch_info = f"{Fore.YELLOW}{batch_size}{Style.RESET_ALL} rows/batch/{difference_info}"
+    # Pick the prebuilt fragments of the batch size state (throttled, normal or boost)
+    throttled_info, batch_color, colour = batch_size_prompts[(batch_size > calculated_batch_size) - (batch_size < calculated_batch_size)]
+    batch_info = f"{batch_color}{batch_size}{Style.RESET_ALL} rows/batch/{difference_info}"
 
-        # Color indicating throttling
-        colour = '#cc745e'
-    elif batch_size > calculated_batch_size:
-        # Throttled Info
-        throttled_info = f'{Fore.BLACK}{Back.LIGHTGREEN_EX}boost{Style.RESET_ALL}'
+    # Return the color and the full progress message, with the (cached) primary key information
+    return colour, f"[{throttled_info}] [{batch_info}] [{get_pk_info(pk, pk_count)}] {db_name}.{table_name}"
 
-        # Batch size increased due to boost, display in green
-        batch_info = f"{Fore.GREEN}{batch_size}{Style.RESET_ALL} rows/batch/{difference_info}"
 
-        # Boost batch size color
-        colour = '#ccb15e'
-    else:
-        # Throttled Info
-        throttled_info = f'{Fore.WHITE}{Back.BLUE}normal{Style.RESET_ALL}'
-
-        # Batch size increased due to boost, display in green
-        batch_info = f"{Fore.GREEN}{batch_size}{Style.RESET_ALL} rows/batch/{difference_info}"
-
-        # Normal batch size color
-        colour = '#cc995e'
+@lru_cache(maxsize=4096)
+def get_pk_info(pk: str, pk_count: int) -> str:
+    """
+    Builds the primary key part of the progress message. It never changes during the migration of
+    a table, so results are cached.
 
-    # Add primary key information to the progress message
+    :param pk: The primary key column for the table (or '*' if none).
+    :param pk_count: The number of primary key columns in the table.
+    :return: The colored primary key information.
+    """
     if pk != '*' and pk_count == 1:
         # If there's a single primary key, display it in green
-        pk_info = f'{Fore.GREEN}{pk.replace("`", "")}{Style.RESET_ALL}'
-    else:
-        if pk_count > 1:
-            # Multiple primary keys, display the count in yellow
-            pk_info = f'{Fore.YELLOW}{pk_count}pks{Style.RESET_ALL}'
-        else:
-            # No primary key, display an error in red
-            pk_info = f'{Fore.RED}no pk{Style.RESET_ALL}'
-
-    # Return the color and the full progress message
-    return colour, f"[{throttled_info}] [{batch_info}] [{pk_info}] {db_name}.{table_name}"
+        return f'{Fore.GREEN}{pk.replace("`", "")}{Style.RESET_ALL}'
+
+    if pk_count > 1:
+        # Multiple primary keys, display the count in yellow
+        return f'{Fore.YELLOW}{pk_count}pks{Style.RESET_ALL}'
+
+    # No primary key, display an error in red
+    return f'{Fore.RED}no pk{Style.RESET_ALL}'